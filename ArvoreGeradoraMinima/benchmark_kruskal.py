@@ -0,0 +1,76 @@
+"""
+Benchmark: Kruskal vs Filter-Kruskal em grafos de densidade crescente
+Uso: python benchmark_kruskal.py [num_cidades]
+
+Quanto mais denso o grafo, maior a fração de arestas que o Filter-Kruskal
+descarta sem ordenar, e maior a vantagem sobre o Kruskal comum.
+Dependência opcional: pip install numpy
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from typing import Callable, Optional, Tuple
+
+from mst_cidades import GrafoMST
+
+# Grau médio de cada grafo gerado (densidade = E / V = grau médio / 2)
+GRAUS_MEDIOS = [4, 16, 64, 256]
+
+
+def gerar_grafo(num_cidades: int, grau_medio: int, semente: int = 42) -> GrafoMST:
+    # Grafo aleatório conexo: árvore aleatória + arestas extras até o grau médio
+    gerador = random.Random(semente)
+    grafo = GrafoMST()
+    num_arestas = num_cidades * grau_medio // 2
+
+    # adicionar_estrada imprime cada estrada: silencia durante a geração
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(1, num_cidades):
+            grafo.adicionar_estrada(f"C{i}", f"C{gerador.randrange(i)}", gerador.uniform(1, 1000))
+        for _ in range(num_arestas - (num_cidades - 1)):
+            a, b = gerador.sample(range(num_cidades), 2)
+            grafo.adicionar_estrada(f"C{a}", f"C{b}", gerador.uniform(1, 1000))
+    return grafo
+
+
+def cronometrar(algoritmo: Callable[[], Optional[Tuple[list, float]]]) -> Tuple[float, float]:
+    # Executa o algoritmo sem a saída detalhada; retorna (segundos, peso da MST)
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        resultado = algoritmo()
+        tempo = time.perf_counter() - inicio
+    return tempo, resultado[1]
+
+
+def main() -> None:
+    num_cidades = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print("\n" + "="*70)
+    print(f"BENCHMARK: KRUSKAL vs FILTER-KRUSKAL ({num_cidades} cidades)")
+    print("="*70)
+    print(f"{'Grau médio':>10} {'Arestas':>10} {'Kruskal':>12} {'Filter-K.':>12} {'Speedup':>9}")
+    print("─"*70)
+
+    # Aquecimento: a primeira chamada paga a importação do NumPy
+    cronometrar(gerar_grafo(10, 4).filter_kruskal)
+
+    for grau_medio in GRAUS_MEDIOS:
+        grafo = gerar_grafo(num_cidades, grau_medio)
+        tempo_k, peso_k = cronometrar(grafo.kruskal)
+        tempo_f, peso_f = cronometrar(grafo.filter_kruskal)
+
+        if abs(peso_k - peso_f) > 1e-6:
+            print(f"ERRO: pesos diferentes ({peso_k:.1f} vs {peso_f:.1f})")
+            return
+
+        print(f"{grau_medio:>10} {len(grafo.arestas):>10} {tempo_k:>11.3f}s {tempo_f:>11.3f}s "
+              f"{tempo_k / tempo_f:>8.1f}x")
+
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
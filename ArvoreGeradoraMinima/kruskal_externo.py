@@ -0,0 +1,173 @@
+"""
+Kruskal em memória externa
+Problema: Calcular a MST de listas de estradas maiores que a memória RAM
+
+As estradas são lidas de um arquivo CSV (origem,destino,distancia), ordenadas em
+blocos ("runs") gravados em disco e intercaladas com heapq.merge (k-way merge).
+A memória de pico é O(V) (nomes + Union-Find) mais o buffer configurado.
+"""
+
+import csv
+import heapq
+import os
+import struct
+import tempfile
+from contextlib import ExitStack
+from operator import itemgetter
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mst_cidades import Aresta, GrafoMST, UnionFindIds
+
+# Registro binário de cada estrada nos runs: distância (float64) + dois ids (int32)
+REGISTRO = struct.Struct('<dii')
+
+
+def salvar_estradas(grafo: GrafoMST, caminho: str) -> None:
+    # Grava as estradas do grafo no formato lido por kruskal_externo
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        for aresta in grafo.arestas:
+            escritor.writerow((aresta.origem, aresta.destino, aresta.peso))
+
+
+def _ler_estradas(caminho: str, indices: Dict[str, int],
+                  nomes: List[str]) -> Iterator[Tuple[float, int, int]]:
+    # Lê o CSV em streaming, atribuindo ids às cidades na primeira aparição
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        for origem, destino, distancia in csv.reader(arquivo):
+            for cidade in (origem, destino):
+                if cidade not in indices:
+                    indices[cidade] = len(nomes)
+                    nomes.append(cidade)
+            yield (float(distancia), indices[origem], indices[destino])
+
+
+def _gravar_run(buffer: Iterable[Tuple[float, int, int]], diretorio: str, numero: int) -> str:
+    # Grava registros já ordenados como run binário
+    caminho = os.path.join(diretorio, f"run_{numero:06d}.bin")
+    with open(caminho, 'wb') as arquivo:
+        for registro in buffer:
+            arquivo.write(REGISTRO.pack(*registro))
+    return caminho
+
+
+def _intercalar_grupos(runs: List[str], diretorio: str, max_abertos: int,
+                       registros_por_bloco: int) -> List[str]:
+    # Passadas de intercalação com fan-in limitado: funde grupos de até
+    # max_abertos runs em runs maiores até restarem no máximo max_abertos
+    # Os grupos são consecutivos e heapq.merge é estável, então a ordem
+    # original das estradas de mesma distância é preservada
+    numero = len(runs)
+    while len(runs) > max_abertos:
+        proximos: List[str] = []
+        for inicio in range(0, len(runs), max_abertos):
+            grupo = runs[inicio:inicio + max_abertos]
+            if len(grupo) == 1:
+                proximos.append(grupo[0])
+                continue
+            with ExitStack() as pilha:
+                fluxos = [_ler_run(pilha.enter_context(open(run, 'rb')), registros_por_bloco)
+                          for run in grupo]
+                proximos.append(_gravar_run(heapq.merge(*fluxos, key=itemgetter(0)),
+                                            diretorio, numero))
+            numero += 1
+            for run in grupo:
+                os.remove(run)
+        runs = proximos
+    return runs
+
+
+def _ler_run(arquivo: BinaryIO, registros_por_bloco: int) -> Iterator[Tuple[float, int, int]]:
+    # Lê um run em blocos de tamanho fixo
+    tamanho_bloco = registros_por_bloco * REGISTRO.size
+    while True:
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            return
+        yield from REGISTRO.iter_unpack(bloco)
+
+
+def kruskal_externo(caminho: str, tamanho_buffer: int = 1_000_000,
+                    diretorio_temp: Optional[str] = None,
+                    max_runs_abertos: int = 64) -> Optional[Tuple[List[Aresta], float]]:
+    # ALGORITMO DE KRUSKAL EM MEMÓRIA EXTERNA
+    # 1. Lê o arquivo em blocos de até tamanho_buffer estradas, ordena e grava cada run
+    # 2. Intercala os runs ordenados com heapq.merge, lendo cada um aos poucos;
+    #    com mais de max_runs_abertos runs, faz passadas intermediárias para
+    #    nunca manter mais que esse número de arquivos abertos
+    # 3. Alimenta o Union-Find uma estrada por vez e para com V-1 arestas aceitas
+    # Runs e merge são estáveis, então o resultado é o mesmo de GrafoMST.kruskal
+    # para as mesmas estradas na mesma ordem
+
+    print("\n" + "="*70)
+    print("ALGORITMO DE KRUSKAL (MEMÓRIA EXTERNA) - ÁRVORE GERADORA MÍNIMA")
+    print("="*70)
+
+    if tamanho_buffer < 1:
+        raise ValueError("tamanho_buffer deve ser positivo")
+    if max_runs_abertos < 2:
+        raise ValueError("max_runs_abertos deve ser pelo menos 2")
+
+    indices: Dict[str, int] = {}
+    nomes: List[str] = []
+
+    with tempfile.TemporaryDirectory(dir=diretorio_temp) as diretorio, ExitStack() as pilha:
+        runs: List[str] = []
+        buffer: List[Tuple[float, int, int]] = []
+        total_arestas = 0
+
+        for registro in _ler_estradas(caminho, indices, nomes):
+            buffer.append(registro)
+            total_arestas += 1
+            if len(buffer) == tamanho_buffer:
+                # Ordenação estável por distância antes de gravar
+                buffer.sort(key=itemgetter(0))
+                runs.append(_gravar_run(buffer, diretorio, len(runs)))
+                buffer = []
+
+        if total_arestas == 0:
+            print("ERRO: Grafo sem arestas!")
+            return None
+
+        if runs:
+            if buffer:
+                buffer.sort(key=itemgetter(0))
+                runs.append(_gravar_run(buffer, diretorio, len(runs)))
+            buffer = []
+            total_runs = len(runs)
+            # O buffer é dividido entre os runs abertos durante cada intercalação
+            registros_por_bloco = max(1, tamanho_buffer // min(len(runs), max_runs_abertos))
+            runs = _intercalar_grupos(runs, diretorio, max_runs_abertos, registros_por_bloco)
+            fluxos = [_ler_run(pilha.enter_context(open(run, 'rb')), registros_por_bloco)
+                      for run in runs]
+            ordenadas = heapq.merge(*fluxos, key=itemgetter(0))
+        else:
+            # Tudo coube no buffer: ordena em memória, sem tocar o disco
+            total_runs = 0
+            buffer.sort(key=itemgetter(0))
+            ordenadas = iter(buffer)
+
+        print(f"\nTotal de arestas: {total_arestas} | Cidades: {len(nomes)} | Runs em disco: {total_runs}")
+
+        uf = UnionFindIds(len(nomes))
+        mst_arestas: List[Aresta] = []
+        peso_total_mst = 0.0
+        arestas_processadas = 0
+
+        for distancia, origem, destino in ordenadas:
+            arestas_processadas += 1
+            if uf.union(origem, destino):
+                mst_arestas.append(Aresta(nomes[origem], nomes[destino], distancia))
+                peso_total_mst += distancia
+                # Para quando tiver V-1 arestas
+                if len(mst_arestas) == len(nomes) - 1:
+                    break
+
+    # Verifica se grafo é conexo
+    if len(mst_arestas) != len(nomes) - 1:
+        print(f"ERRO: Grafo não é totalmente conexo!")
+        return None
+
+    print(f"Arestas processadas até completar a MST: {arestas_processadas}")
+    print(f"\nMST completa com {len(mst_arestas)} arestas")
+    return (mst_arestas, peso_total_mst)
@@ -1,4 +1,6 @@
-from typing import Dict, List, Set, Tuple, Optional
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 from dataclasses import dataclass
 
 
@@ -21,42 +23,78 @@ class Aresta:
         return self.peso <= outro.peso
 
 
+class UnionFindIds:
+    # Union-Find compacto sobre ids inteiros contíguos 0..n-1
+    # pai e tamanho ficam em array('i') (4 bytes por elemento, sem hash de strings)
+    # find é iterativo com "path halving" e union é por tamanho,
+    # então não há recursão nem cadeias longas de pais
+
+    def __init__(self, n: int) -> None:
+        # pai: representante provisório de cada id
+        # tamanho: número de elementos do conjunto (válido só nas raízes)
+        self.pai = array('i', range(n))
+        self.tamanho = array('i', [1]) * n
+        self.num_conjuntos = n
+
+    def __len__(self) -> int:
+        return len(self.pai)
+
+    def find(self, x: int) -> int:
+        # Representante do conjunto de x; cada nó visitado passa a apontar para o avô
+        pai = self.pai
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        # Une os conjuntos de x e y (o menor vai para baixo do maior)
+        # Retorna False se já estavam no mesmo conjunto
+        raiz_x = self.find(x)
+        raiz_y = self.find(y)
+        if raiz_x == raiz_y:
+            return False
+
+        if self.tamanho[raiz_x] < self.tamanho[raiz_y]:
+            raiz_x, raiz_y = raiz_y, raiz_x
+        self.pai[raiz_y] = raiz_x
+        self.tamanho[raiz_x] += self.tamanho[raiz_y]
+        self.num_conjuntos -= 1
+        return True
+
+    def union_many(self, origens: Iterable[int], destinos: Iterable[int]) -> bytearray:
+        # Une em lote os pares (origens[i], destinos[i]) de dois arrays de arestas
+        # Retorna uma máscara com 1 nas arestas que uniram conjuntos distintos
+        # (no Kruskal, exatamente as arestas que entram na MST)
+        union = self.union
+        return bytearray(union(x, y) for x, y in zip(origens, destinos))
+
+    def sao_conectados(self, x: int, y: int) -> bool:
+        # Verifica se dois ids estão no mesmo conjunto
+        return self.find(x) == self.find(y)
+
+
 class UnionFind:
-    # Estrutura Union-Find para detectar ciclos no Kruskal
-    # Utiliza compressão de caminho e union por rank para otimização
+    # Estrutura Union-Find para detectar ciclos, endereçada por nome de cidade
+    # Traduz cada nome para um id uma única vez e delega para UnionFindIds
 
-    def __init__(self, elementos: Set[str]) -> None:
-        # pai: mapa de cada elemento para seu representante
-        # rank: altura da árvore para otimizar operações
-        self.pai: Dict[str, str] = {elem: elem for elem in elementos}
-        self.rank: Dict[str, int] = {elem: 0 for elem in elementos}
+    def __init__(self, elementos: Iterable[str]) -> None:
+        # nomes: id -> nome; indices: nome -> id contíguo
+        self.nomes: List[str] = list(elementos)
+        self.indices: Dict[str, int] = {elem: i for i, elem in enumerate(self.nomes)}
+        self.ids = UnionFindIds(len(self.nomes))
 
     def find(self, x: str) -> str:
-        # Encontra o representante do conjunto com compressão de caminho
-        if self.pai[x] != x:
-            self.pai[x] = self.find(self.pai[x])
-        return self.pai[x]
+        # Encontra o representante (nome) do conjunto de x
+        return self.nomes[self.ids.find(self.indices[x])]
 
-    def union(self, x: str, y: str) -> None:
-        # Une dois conjuntos usando union por rank
-        raiz_x = self.find(x)
-        raiz_y = self.find(y)
-
-        if raiz_x == raiz_y:
-            return
-
-        # Une por rank para manter a árvore balanceada
-        if self.rank[raiz_x] < self.rank[raiz_y]:
-            self.pai[raiz_x] = raiz_y
-        elif self.rank[raiz_x] > self.rank[raiz_y]:
-            self.pai[raiz_y] = raiz_x
-        else:
-            self.pai[raiz_y] = raiz_x
-            self.rank[raiz_x] += 1
+    def union(self, x: str, y: str) -> bool:
+        # Une os conjuntos de duas cidades; False se já estavam unidos
+        return self.ids.union(self.indices[x], self.indices[y])
 
     def sao_conectados(self, x: str, y: str) -> bool:
         # Verifica se dois elementos estão no mesmo conjunto
-        return self.find(x) == self.find(y)
+        return self.ids.sao_conectados(self.indices[x], self.indices[y])
 
 
 class GrafoMST:
@@ -131,22 +169,26 @@ class GrafoMST:
         arestas_ordenadas = sorted(self.arestas)
         print(f"\nTotal de arestas: {len(arestas_ordenadas)}")
 
+        # Converte os nomes em ids uma única vez; o laço roda só sobre inteiros
+        indices = {cidade: i for i, cidade in enumerate(self.cidades)}
+        origens = array('i', (indices[a.origem] for a in arestas_ordenadas))
+        destinos = array('i', (indices[a.destino] for a in arestas_ordenadas))
+
         # Estrutura Union-Find para detectar ciclos
-        uf = UnionFind(self.cidades)
+        uf = UnionFindIds(len(indices))
         mst_arestas: List[Aresta] = []
         peso_total_mst = 0.0
         arestas_processadas = 0
         ciclos_evitados = 0
 
         # Processa cada aresta em ordem de peso
-        for aresta in arestas_ordenadas:
+        for i, aresta in enumerate(arestas_ordenadas):
             arestas_processadas += 1
 
-            # Se não criar ciclo, adiciona à MST
-            if not uf.sao_conectados(aresta.origem, aresta.destino):
+            # Se não criar ciclo (union une conjuntos distintos), adiciona à MST
+            if uf.union(origens[i], destinos[i]):
                 mst_arestas.append(aresta)
                 peso_total_mst += aresta.peso
-                uf.union(aresta.origem, aresta.destino)
                 print(f"ADICIONA: {aresta.origem} ↔ {aresta.destino} ({aresta.peso:.1f} km)")
                 # Para quando tiver V-1 arestas
                 if len(mst_arestas) == len(self.cidades) - 1:
@@ -163,11 +205,70 @@ class GrafoMST:
         print(f"\nMST completa com {len(mst_arestas)} arestas")
         return (mst_arestas, peso_total_mst)
 
-    def prim(self, inicio: Optional[str] = None) -> Optional[Tuple[List[Aresta], float]]:
+    def prim(self, inicio: Optional[str] = None,
+             referencia: bool = False) -> Optional[Tuple[List[Aresta], float]]:
         # ALGORITMO DE PRIM - MST por crescimento incremental
         # 1. Começa com um vértice
         # 2. Sempre adiciona a aresta de menor peso que conecta a MST a fora
         # 3. Expande até cobrir todos os vértices
+        # Fronteira em heap binário (heapq, versão "preguiçosa"): O(E log V)
+        # referencia=True usa a varredura completa da fronteira a cada etapa (O(V·E)),
+        # mantida para conferência nos testes
+
+        if referencia:
+            return self._prim_referencia(inicio)
+
+        print("\n" + "="*70)
+        print("ALGORITMO DE PRIM - ÁRVORE GERADORA MÍNIMA")
+        print("="*70)
+
+        if not self.cidades:
+            print("ERRO: Grafo sem vértices!")
+            return None
+
+        # Define vértice inicial
+        if inicio is None or inicio not in self.cidades:
+            inicio = list(self.cidades)[0]
+
+        na_mst: Set[str] = {inicio}
+        mst_arestas: List[Aresta] = []
+        peso_total_mst = 0.0
+        etapa = 1
+
+        # Heap com (peso, origem, destino) das arestas que saem da MST
+        # Entradas cujo destino já entrou na MST são descartadas ao sair do heap
+        fronteira: List[Tuple[float, str, str]] = [
+            (peso, inicio, vizinho) for vizinho, peso in self.adjacencias[inicio]
+        ]
+        heapq.heapify(fronteira)
+
+        while fronteira and len(na_mst) < len(self.cidades):
+            peso, origem, destino = heapq.heappop(fronteira)
+            if destino in na_mst:
+                continue
+
+            etapa += 1
+            # Aresta só é criada quando entra na MST
+            mst_arestas.append(Aresta(origem, destino, peso))
+            peso_total_mst += peso
+            na_mst.add(destino)
+            print(f"Etapa {etapa}: Adiciona {origem} ↔ {destino} ({peso:.1f} km)")
+
+            for vizinho, peso_vizinho in self.adjacencias[destino]:
+                if vizinho not in na_mst:
+                    heapq.heappush(fronteira, (peso_vizinho, destino, vizinho))
+
+        # Verifica se grafo é conexo
+        if len(na_mst) != len(self.cidades):
+            print(f"ERRO: Grafo não é totalmente conexo!")
+            return None
+
+        print(f"\nMST completa com {len(mst_arestas)} arestas")
+        return (mst_arestas, peso_total_mst)
+
+    def _prim_referencia(self, inicio: Optional[str] = None) -> Optional[Tuple[List[Aresta], float]]:
+        # Prim original: a cada etapa percorre todos os vértices da MST e suas
+        # adjacências em busca da menor aresta de saída - O(V·E)
 
         print("\n" + "="*70)
         print("ALGORITMO DE PRIM - ÁRVORE GERADORA MÍNIMA")
@@ -204,6 +305,11 @@ class GrafoMST:
                         melhor_aresta = Aresta(vertice_mst, vizinho, peso)
                         melhor_peso = peso
 
+            # Sem aresta de saída: o restante do grafo é inalcançável
+            if melhor_aresta is None:
+                print(f"ERRO: Grafo não é totalmente conexo!")
+                return None
+
             # Adiciona a melhor aresta encontrada
             if melhor_aresta:
                 mst_arestas.append(melhor_aresta)
@@ -216,6 +322,225 @@ class GrafoMST:
         print(f"\nMST completa com {len(mst_arestas)} arestas")
         return (mst_arestas, peso_total_mst)
 
+    def boruvka(self, vetorizado: bool = False) -> Optional[Tuple[List[Aresta], float]]:
+        # ALGORITMO DE BORŮVKA - MST por rodadas de contração
+        # 1. Cada componente escolhe sua aresta de saída mais barata
+        # 2. Todas as escolhidas entram na MST de uma vez (componentes se fundem)
+        # 3. Repete: o número de componentes cai pelo menos à metade por rodada,
+        #    então são O(log V) rodadas de O(E) cada
+        # Empates são desfeitos por (peso, posição da aresta), o que garante que
+        # as escolhas de uma rodada nunca formam ciclo
+        # vetorizado=True faz a busca de cada rodada com reduções NumPy (dependência opcional)
+
+        print("\n" + "="*70)
+        print("ALGORITMO DE BORŮVKA - ÁRVORE GERADORA MÍNIMA")
+        print("="*70)
+
+        if not self.arestas:
+            print("ERRO: Grafo sem arestas!")
+            return None
+
+        # Converte os nomes em ids uma única vez
+        indices = {cidade: i for i, cidade in enumerate(self.cidades)}
+        origens = array('i', (indices[a.origem] for a in self.arestas))
+        destinos = array('i', (indices[a.destino] for a in self.arestas))
+        uf = UnionFindIds(len(indices))
+
+        if vetorizado:
+            escolhidas = self._boruvka_vetorizado(origens, destinos, uf)
+        else:
+            escolhidas = self._boruvka_python(origens, destinos, uf)
+
+        if uf.num_conjuntos != 1:
+            print(f"ERRO: Grafo não é totalmente conexo!")
+            return None
+
+        mst_arestas = [self.arestas[i] for i in escolhidas]
+        peso_total_mst = sum((a.peso for a in mst_arestas), 0.0)
+        print(f"\nMST completa com {len(mst_arestas)} arestas")
+        return (mst_arestas, peso_total_mst)
+
+    def _boruvka_python(self, origens: array, destinos: array, uf: UnionFindIds) -> List[int]:
+        # Rodadas de Borůvka em Python puro; retorna as posições das arestas da MST
+        pesos = [a.peso for a in self.arestas]
+        escolhidas: List[int] = []
+        rodada = 0
+
+        while uf.num_conjuntos > 1:
+            rodada += 1
+            componentes_antes = uf.num_conjuntos
+            # melhor[raiz]: posição da aresta de saída mais barata do componente
+            melhor: Dict[int, int] = {}
+            for i in range(len(pesos)):
+                raiz_u = uf.find(origens[i])
+                raiz_v = uf.find(destinos[i])
+                if raiz_u == raiz_v:
+                    continue
+                chave = (pesos[i], i)
+                for raiz in (raiz_u, raiz_v):
+                    atual = melhor.get(raiz)
+                    if atual is None or chave < (pesos[atual], atual):
+                        melhor[raiz] = i
+
+            if not melhor:
+                break
+            for i in sorted(set(melhor.values())):
+                if uf.union(origens[i], destinos[i]):
+                    escolhidas.append(i)
+            print(f"Rodada {rodada}: {componentes_antes} → {uf.num_conjuntos} componentes")
+
+        return escolhidas
+
+    def _boruvka_vetorizado(self, origens: array, destinos: array, uf: UnionFindIds) -> List[int]:
+        # Rodadas de Borůvka com NumPy: a aresta mais barata de cada componente
+        # sai de uma redução np.minimum.at sobre todas as arestas ativas da rodada
+        try:
+            import numpy as np
+        except ImportError:
+            print("❌ ERRO: Instale as bibliotecas necessárias:")
+            print("   pip install numpy")
+            raise
+
+        pesos = np.fromiter((a.peso for a in self.arestas), dtype=np.float64, count=len(self.arestas))
+        # Ordena uma vez por (peso, posição): o menor "posto" é a aresta mais barata
+        ordem = np.argsort(pesos, kind='stable')
+        u = np.frombuffer(origens, dtype=np.int32)[ordem]
+        v = np.frombuffer(destinos, dtype=np.int32)[ordem]
+        postos = np.arange(len(ordem), dtype=np.int64)
+        sem_aresta = len(ordem)
+
+        rotulo = np.arange(len(uf), dtype=np.int32)
+        escolhidas: List[int] = []
+        rodada = 0
+
+        while uf.num_conjuntos > 1:
+            rodada += 1
+            componentes_antes = uf.num_conjuntos
+            cu = rotulo[u]
+            cv = rotulo[v]
+            # Descarta de vez as arestas internas (não voltam a ser úteis)
+            externas = cu != cv
+            u, v, postos, cu, cv = u[externas], v[externas], postos[externas], cu[externas], cv[externas]
+            if len(postos) == 0:
+                break
+
+            melhor = np.full(len(rotulo), sem_aresta, dtype=np.int64)
+            np.minimum.at(melhor, cu, postos)
+            np.minimum.at(melhor, cv, postos)
+
+            # Contração: une as escolhidas e recalcula o rótulo de cada cidade
+            for posto in np.unique(melhor[melhor < sem_aresta]).tolist():
+                i = int(ordem[posto])
+                if uf.union(origens[i], destinos[i]):
+                    escolhidas.append(i)
+            pai = np.frombuffer(uf.pai, dtype=np.int32).copy()
+            while True:
+                avo = pai[pai]
+                if np.array_equal(avo, pai):
+                    break
+                pai = avo
+            rotulo = pai
+            print(f"Rodada {rodada}: {componentes_antes} → {uf.num_conjuntos} componentes")
+
+        return escolhidas
+
+    def filter_kruskal(self, limiar: int = 4096) -> Optional[Tuple[List[Aresta], float]]:
+        # ALGORITMO FILTER-KRUSKAL - Kruskal sem ordenar todas as arestas
+        # 1. Particiona as arestas em torno de um pivô de peso (leves | pesadas)
+        # 2. Resolve primeiro as leves (recursivamente)
+        # 3. Filtra as pesadas contra o Union-Find: as que ligam cidades já
+        #    conectadas são descartadas sem nunca serem ordenadas
+        # 4. Segmentos com até 'limiar' arestas caem no Kruskal comum
+        # Partição e filtro são operações vetorizadas sobre arrays NumPy
+        # (dependência opcional); empates seguem a ordem de inserção, então o
+        # resultado é o mesmo de kruskal()
+
+        print("\n" + "="*70)
+        print("ALGORITMO FILTER-KRUSKAL - ÁRVORE GERADORA MÍNIMA")
+        print("="*70)
+
+        try:
+            import numpy as np
+        except ImportError:
+            print("❌ ERRO: Instale as bibliotecas necessárias:")
+            print("   pip install numpy")
+            raise
+
+        if not self.arestas:
+            print("ERRO: Grafo sem arestas!")
+            return None
+
+        # Converte os nomes em ids uma única vez
+        indices = {cidade: i for i, cidade in enumerate(self.cidades)}
+        num_arestas = len(self.arestas)
+        pesos = np.fromiter((a.peso for a in self.arestas), dtype=np.float64, count=num_arestas)
+        origens = np.fromiter((indices[a.origem] for a in self.arestas), dtype=np.int32, count=num_arestas)
+        destinos = np.fromiter((indices[a.destino] for a in self.arestas), dtype=np.int32, count=num_arestas)
+        posicoes = np.arange(num_arestas, dtype=np.int64)
+
+        uf = UnionFindIds(len(indices))
+        meta = len(indices) - 1
+        escolhidas: List[int] = []
+        rotulo = np.arange(len(indices), dtype=np.int32)
+        conjuntos_no_rotulo = uf.num_conjuntos
+        descartadas = 0
+
+        # Pilha de segmentos (pesos, origens, destinos, posições); o topo é sempre
+        # o segmento mais leve ainda pendente, o que dispensa recursão
+        pilha = [(pesos, origens, destinos, posicoes)]
+
+        while pilha and len(escolhidas) < meta:
+            w, u, v, p = pilha.pop()
+
+            # Filtro: descarta arestas internas a um componente (rótulos atualizados
+            # por pointer jumping só quando o Union-Find mudou)
+            if uf.num_conjuntos != conjuntos_no_rotulo:
+                rotulo = np.frombuffer(uf.pai, dtype=np.int32).copy()
+                while True:
+                    avo = rotulo[rotulo]
+                    if np.array_equal(avo, rotulo):
+                        break
+                    rotulo = avo
+                conjuntos_no_rotulo = uf.num_conjuntos
+                externas = rotulo[u] != rotulo[v]
+                descartadas += len(w) - int(np.count_nonzero(externas))
+                w, u, v, p = w[externas], u[externas], v[externas], p[externas]
+
+            if len(w) == 0:
+                continue
+
+            if len(w) > limiar:
+                # Pivô: mediana de uma amostra regular dos pesos
+                amostra = w[np.linspace(0, len(w) - 1, min(len(w), 1001)).astype(np.int64)]
+                pivo = np.median(amostra)
+                leves = w < pivo
+                if not leves.any():
+                    leves = w <= pivo
+                if not leves.all():
+                    pesadas = ~leves
+                    pilha.append((w[pesadas], u[pesadas], v[pesadas], p[pesadas]))
+                    pilha.append((w[leves], u[leves], v[leves], p[leves]))
+                    continue
+                # Todos os pesos iguais: não há como particionar, segue para o Kruskal comum
+
+            # Kruskal comum no segmento: ordena por (peso, posição original)
+            for k in np.lexsort((p, w)).tolist():
+                if uf.union(int(u[k]), int(v[k])):
+                    escolhidas.append(int(p[k]))
+                    if len(escolhidas) == meta:
+                        break
+
+        # Verifica se grafo é conexo
+        if len(escolhidas) != meta:
+            print(f"ERRO: Grafo não é totalmente conexo!")
+            return None
+
+        mst_arestas = [self.arestas[i] for i in escolhidas]
+        peso_total_mst = sum((a.peso for a in mst_arestas), 0.0)
+        print(f"\nTotal de arestas: {num_arestas} | Descartadas pelo filtro: {descartadas}")
+        print(f"\nMST completa com {len(mst_arestas)} arestas")
+        return (mst_arestas, peso_total_mst)
+
     def exibir_mst(self, mst_arestas: List[Aresta], peso_total: float,
                    nome_algoritmo: str) -> None:
         # Exibe a MST de forma formatada
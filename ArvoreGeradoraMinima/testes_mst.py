@@ -2,7 +2,12 @@
 Testes automatizados para MST - Kruskal, Prim e UnionFind
 """
 
-from mst_cidades import GrafoMST, UnionFind, Aresta, criar_mapa_brasil_ponderado
+import os
+import random
+import tempfile
+
+from mst_cidades import GrafoMST, UnionFind, UnionFindIds, Aresta, criar_mapa_brasil_ponderado
+from kruskal_externo import kruskal_externo, salvar_estradas
 
 
 def teste_union_find():
@@ -215,6 +220,216 @@ def teste_aresta_menor_primeiro():
     print("\n✅ TESTE 6: Ordenação de Peso - PASSOU\n")
 
 
+def teste_prim_heap_vs_referencia():
+    """Compara o Prim com heap ao Prim de referência (varredura O(V·E))."""
+    print("\n" + "="*70)
+    print("TESTE 7: Prim com Heap vs Referência")
+    print("="*70)
+
+    # Grafo aleatório conexo com pesos distintos (MST única)
+    gerador = random.Random(42)
+    num_cidades = 60
+    pesos = gerador.sample(range(1, 100000), 400)
+    grafo = GrafoMST()
+    for i in range(1, num_cidades):
+        grafo.adicionar_estrada(f"C{i}", f"C{gerador.randrange(i)}", pesos.pop())
+    while pesos:
+        a, b = gerador.sample(range(num_cidades), 2)
+        grafo.adicionar_estrada(f"C{a}", f"C{b}", pesos.pop())
+
+    for inicio in ["C0", "C17", "C59"]:
+        arestas_h, peso_h = grafo.prim(inicio)
+        arestas_r, peso_r = grafo.prim(inicio, referencia=True)
+
+        assert peso_h == peso_r, f"Pesos devem ser iguais: {peso_h} vs {peso_r}"
+        assert [(a.origem, a.destino, a.peso) for a in arestas_h] == \
+               [(a.origem, a.destino, a.peso) for a in arestas_r], "Mesmas arestas, na mesma ordem"
+        print(f"✓ Início {inicio}: mesmas {len(arestas_h)} arestas, peso {peso_h:.1f}")
+
+    arestas_k, peso_k = grafo.kruskal()
+    assert peso_k == peso_h, f"Kruskal e Prim devem concordar: {peso_k} vs {peso_h}"
+    print(f"✓ Kruskal concorda: {peso_k:.1f}")
+
+    print("\n🔍 Grafo desconexo:")
+    grafo.adicionar_estrada("X", "Y", 1)
+    assert grafo.prim("C0") is None, "Prim deve falhar em grafo desconexo"
+    assert grafo.prim("C0", referencia=True) is None, "Referência deve falhar em grafo desconexo"
+    print("✓ Ambas as versões detectam grafo desconexo")
+
+    print("\n✅ TESTE 7: Prim com Heap - PASSOU\n")
+
+
+def teste_union_find_ids():
+    """Testa o Union-Find sobre ids inteiros (array, iterativo, union por tamanho)."""
+    print("\n" + "="*70)
+    print("TESTE 8: Union-Find com Ids Inteiros")
+    print("="*70)
+
+    # Cadeia longa: find iterativo não pode estourar a recursão
+    n = 200000
+    uf = UnionFindIds(n)
+    for i in range(1, n):
+        uf.union(i - 1, i)
+    assert uf.num_conjuntos == 1, f"Deve restar 1 conjunto, restam {uf.num_conjuntos}"
+    assert uf.sao_conectados(0, n - 1), "Extremos da cadeia devem estar conectados"
+    assert uf.tamanho[uf.find(0)] == n, "Raiz deve guardar o tamanho do conjunto"
+    print(f"✓ Cadeia com {n} ids unida sem recursão")
+
+    # union_many: máscara marca só as arestas que uniram conjuntos distintos
+    uf = UnionFindIds(5)
+    mascara = uf.union_many([0, 1, 0, 3, 2], [1, 2, 2, 4, 4])
+    assert list(mascara) == [1, 1, 0, 1, 1], f"Máscara inesperada: {list(mascara)}"
+    assert uf.num_conjuntos == 1, "Todos os ids devem estar no mesmo conjunto"
+    print("✓ union_many descarta a aresta que fecharia ciclo")
+
+    # Versão por nome continua funcionando sobre os ids
+    uf = UnionFind(["A", "B", "C"])
+    assert uf.union("A", "B") and not uf.union("B", "A"), "Segunda união deve ser redundante"
+    assert uf.find("B") == uf.find("A") and uf.find("C") == "C", "Representantes por nome"
+    print("✓ UnionFind por nome delega para os ids")
+
+    print("\n✅ TESTE 8: Union-Find com Ids - PASSOU\n")
+
+
+def teste_boruvka():
+    """Compara Borůvka (Python puro e vetorizado) com Kruskal."""
+    print("\n" + "="*70)
+    print("TESTE 9: Borůvka")
+    print("="*70)
+
+    grafo = criar_mapa_brasil_ponderado()
+    _, peso_k = grafo.kruskal()
+    arestas_b, peso_b = grafo.boruvka()
+    assert len(arestas_b) == len(grafo.cidades) - 1, "Deve ter V-1 arestas"
+    assert abs(peso_b - peso_k) < 0.01, f"Pesos devem ser iguais: {peso_b} vs {peso_k}"
+    print(f"✓ Grafo Brasil: Borůvka = Kruskal = {peso_k:.1f} km")
+
+    # Muitos empates: o desempate por posição evita ciclos entre escolhas da mesma rodada
+    gerador = random.Random(7)
+    grafo = GrafoMST()
+    for i in range(1, 80):
+        grafo.adicionar_estrada(f"C{i}", f"C{gerador.randrange(i)}", gerador.choice([1, 2, 3]))
+    for _ in range(300):
+        a, b = gerador.sample(range(80), 2)
+        grafo.adicionar_estrada(f"C{a}", f"C{b}", gerador.choice([1, 2, 3]))
+
+    _, peso_k = grafo.kruskal()
+    arestas_b, peso_b = grafo.boruvka()
+    assert peso_b == peso_k, f"Pesos devem ser iguais: {peso_b} vs {peso_k}"
+    uf = UnionFind(grafo.cidades)
+    assert all(uf.union(a.origem, a.destino) for a in arestas_b), "MST não pode ter ciclo"
+    print(f"✓ Pesos com empates: Borůvka = Kruskal = {peso_k}")
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("⚠ numpy não instalado: versão vetorizada não testada")
+    else:
+        arestas_v, peso_v = grafo.boruvka(vetorizado=True)
+        assert sorted(map(id, arestas_v)) == sorted(map(id, arestas_b)), "Vetorizado deve escolher as mesmas arestas"
+        print("✓ Versão vetorizada escolhe as mesmas arestas")
+
+    grafo.adicionar_estrada("X", "Y", 1)
+    assert grafo.boruvka() is None, "Borůvka deve falhar em grafo desconexo"
+    print("✓ Grafo desconexo detectado")
+
+    print("\n✅ TESTE 9: Borůvka - PASSOU\n")
+
+
+def teste_kruskal_externo():
+    """Compara o Kruskal em memória externa (runs em disco) com o Kruskal em memória."""
+    print("\n" + "="*70)
+    print("TESTE 10: Kruskal em Memória Externa")
+    print("="*70)
+
+    gerador = random.Random(3)
+    grafo_aleatorio = GrafoMST()
+    for i in range(1, 120):
+        grafo_aleatorio.adicionar_estrada(f"C{i}", f"C{gerador.randrange(i)}", gerador.randrange(1, 20))
+    for _ in range(500):
+        a, b = gerador.sample(range(120), 2)
+        grafo_aleatorio.adicionar_estrada(f"C{a}", f"C{b}", gerador.randrange(1, 20))
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        arquivo = os.path.join(diretorio, "estradas.csv")
+
+        for nome, grafo in [("Brasil", criar_mapa_brasil_ponderado()), ("Aleatório", grafo_aleatorio)]:
+            salvar_estradas(grafo, arquivo)
+            arestas_k, peso_k = grafo.kruskal()
+            esperado = [(a.origem, a.destino, a.peso) for a in arestas_k]
+
+            # Buffer pequeno força vários runs; buffer grande ordena em memória
+            for tamanho_buffer in (7, 10 ** 6):
+                arestas_e, peso_e = kruskal_externo(arquivo, tamanho_buffer=tamanho_buffer)
+                assert [(a.origem, a.destino, a.peso) for a in arestas_e] == esperado, \
+                    f"{nome}: arestas diferentes do Kruskal (buffer {tamanho_buffer})"
+                assert abs(peso_e - peso_k) < 0.01, f"{nome}: pesos devem ser iguais: {peso_e} vs {peso_k}"
+            print(f"✓ {nome}: mesmas {len(esperado)} arestas do Kruskal, peso {peso_k:.1f}")
+
+        # Mais runs que o fan-in permitido: força passadas intermediárias de intercalação
+        salvar_estradas(grafo_aleatorio, arquivo)
+        arestas_k, peso_k = grafo_aleatorio.kruskal()
+        for max_abertos in (2, 3, 16):
+            arestas_e, _ = kruskal_externo(arquivo, tamanho_buffer=5, max_runs_abertos=max_abertos)
+            assert [(a.origem, a.destino, a.peso) for a in arestas_e] == \
+                [(a.origem, a.destino, a.peso) for a in arestas_k], \
+                f"Arestas diferentes do Kruskal com fan-in {max_abertos}"
+        print(f"✓ {len(grafo_aleatorio.arestas) // 5 + 1} runs com fan-in 2, 3 e 16: mesmas arestas")
+
+        grafo_aleatorio.adicionar_estrada("X", "Y", 1)
+        salvar_estradas(grafo_aleatorio, arquivo)
+        assert kruskal_externo(arquivo, tamanho_buffer=50) is None, "Deve falhar em grafo desconexo"
+        print("✓ Grafo desconexo detectado")
+
+    print("\n✅ TESTE 10: Kruskal Externo - PASSOU\n")
+
+
+def teste_filter_kruskal():
+    """Compara o Filter-Kruskal com o Kruskal comum."""
+    print("\n" + "="*70)
+    print("TESTE 11: Filter-Kruskal")
+    print("="*70)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("⚠ numpy não instalado: Filter-Kruskal não testado")
+        return
+
+    # Grafo denso com muitos empates de peso
+    gerador = random.Random(11)
+    grafo_denso = GrafoMST()
+    for i in range(1, 100):
+        grafo_denso.adicionar_estrada(f"C{i}", f"C{gerador.randrange(i)}", gerador.randrange(1, 10))
+    for _ in range(2000):
+        a, b = gerador.sample(range(100), 2)
+        grafo_denso.adicionar_estrada(f"C{a}", f"C{b}", gerador.randrange(1, 10))
+
+    for nome, grafo in [("Brasil", criar_mapa_brasil_ponderado()), ("Denso", grafo_denso)]:
+        arestas_k, peso_k = grafo.kruskal()
+        # Limiar pequeno força várias partições e filtros
+        for limiar in (8, 4096):
+            arestas_f, peso_f = grafo.filter_kruskal(limiar=limiar)
+            assert [id(a) for a in arestas_f] == [id(a) for a in arestas_k], \
+                f"{nome}: arestas diferentes do Kruskal (limiar {limiar})"
+            assert peso_f == peso_k, f"{nome}: pesos devem ser iguais: {peso_f} vs {peso_k}"
+        print(f"✓ {nome}: mesmas {len(arestas_k)} arestas do Kruskal, peso {peso_k:.1f}")
+
+    # Pesos todos iguais não podem ser particionados
+    grafo = GrafoMST()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")]:
+        grafo.adicionar_estrada(a, b, 5)
+    _, peso = grafo.filter_kruskal(limiar=1)
+    assert peso == 15, f"Peso deve ser 15, não {peso}"
+    print("✓ Pesos iguais tratados sem partição")
+
+    grafo.adicionar_estrada("X", "Y", 1)
+    assert grafo.filter_kruskal(limiar=1) is None, "Deve falhar em grafo desconexo"
+    print("✓ Grafo desconexo detectado")
+
+    print("\n✅ TESTE 11: Filter-Kruskal - PASSOU\n")
+
+
 def executar_todos_testes():
     """Executa todos os testes."""
     print("\n" + "="*70)
@@ -228,6 +443,11 @@ def executar_todos_testes():
         teste_vertices_diferentes()
         teste_aresta_menor_primeiro()
         teste_grafo_brasil()
+        teste_prim_heap_vs_referencia()
+        teste_union_find_ids()
+        teste_boruvka()
+        teste_kruskal_externo()
+        teste_filter_kruskal()
 
         print("\n" + "="*70)
         print("TODOS OS TESTES PASSARAM!")
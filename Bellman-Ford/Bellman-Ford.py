@@ -1,9 +1,9 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.patches import FancyArrowPatch
 import warnings
 warnings.filterwarnings('ignore')
 
+# matplotlib e networkx são importados apenas em visualizar_grafo:
+# o Bellman-Ford em si roda só com a biblioteca padrão
+
 class GrafoCidadesBrasil:
     def __init__(self, num_vertices):
         # numero cidades no grafo
@@ -12,18 +12,14 @@ class GrafoCidadesBrasil:
         self.arestas = []
         # Mapa de índices para nomes de cidades
         self.cidades = {}
-        # Grafo para visualização
-        self.G = nx.DiGraph()
 
     # Adiciona uma cidade ao mapa
     def adicionar_cidade(self, indice, nome):
         self.cidades[indice] = nome
-        self.G.add_node(indice, label=nome)
 
     # Adiciona uma aresta (rota entre duas cidades com distância em km)
     def adicionar_aresta(self, u, v, distancia_km):
         self.arestas.append((u, v, distancia_km))
-        self.G.add_edge(u, v, weight=distancia_km)
 
     # Implementação do Algoritmo Bellman-Ford
     def bellman_ford(self, origem):
@@ -69,6 +65,21 @@ class GrafoCidadesBrasil:
     
     def visualizar_grafo(self, predecessores, origem, destino=None):
         """Visualiza o grafo com o caminho mais curto destacado"""
+        try:
+            import matplotlib.pyplot as plt
+            import networkx as nx
+        except ImportError:
+            print("❌ ERRO: Instale as bibliotecas necessárias:")
+            print("   pip install matplotlib networkx")
+            raise
+
+        # Grafo para visualização, montado a partir das cidades e arestas
+        self.G = nx.DiGraph()
+        for indice, nome in self.cidades.items():
+            self.G.add_node(indice, label=nome)
+        for u, v, distancia_km in self.arestas:
+            self.G.add_edge(u, v, weight=distancia_km)
+
         plt.figure(figsize=(16, 10))
         
         # Layout do grafo
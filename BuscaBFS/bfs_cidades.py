@@ -4,7 +4,12 @@ Problema: Encontrar o caminho mais curto entre duas cidades
 """
 
 from collections import deque
-from typing import Dict, List, Set, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
+
+from grafo_csr import GrafoCSR, _inicializar_worker, _resolver_lote
+from indice_vizinhanca import IndiceVizinhanca
+from tabela_distancias import TabelaDistancias
 
 
 class GrafoCidades:
@@ -14,29 +19,78 @@ class GrafoCidades:
     def __init__(self):
         # grafo: dicionário onde chave é cidade e valor é lista de vizinhos
         self.grafo: Dict[str, List[str]] = {}
+        # conexoes: vizinho → custo da estrada (0 = sem pedágio, 1 = com pedágio)
+        # Também checa estradas duplicadas em O(1)
+        self.conexoes: Dict[str, Dict[str, int]] = {}
+        # _csr: visão CSR congelada, descartada a cada alteração no mapa
+        self._csr: Optional[GrafoCSR] = None
+        # _tabela: distâncias de todos os pares (opcional), descartada a cada alteração no mapa
+        self._tabela: Optional[TabelaDistancias] = None
+        # vertices_visitados: quantas cidades a última busca marcou como visitadas
+        self.vertices_visitados: int = 0
 
     def adicionar_cidade(self, cidade: str) -> None:
         # Adiciona uma nova cidade (vértice) ao grafo
         if cidade not in self.grafo:
             self.grafo[cidade] = []
+            self.conexoes[cidade] = {}
+            self._invalidar_caches()
             print(f"✓ Cidade '{cidade}' adicionada ao mapa")
 
-    def adicionar_estrada(self, cidade1: str, cidade2: str) -> None:
+    def adicionar_estrada(self, cidade1: str, cidade2: str, custo: int = 1) -> None:
         # Adiciona uma estrada (aresta) bidirecional entre duas cidades
         # Grafo não-direcionado: conexão em ambas as direções
+        # custo: 0 (trecho sem pedágio) ou 1 (com pedágio), usado apenas por bfs_0_1
+        if custo not in (0, 1):
+            raise ValueError(f"Custo da estrada deve ser 0 ou 1, recebido: {custo}")
+
         if cidade1 not in self.grafo:
             self.adicionar_cidade(cidade1)
         if cidade2 not in self.grafo:
             self.adicionar_cidade(cidade2)
 
-        # Adiciona conexão bidirecional
-        if cidade2 not in self.grafo[cidade1]:
+        # Adiciona conexão bidirecional (o dict evita duplicatas sem varrer a lista)
+        # O custo é registrado antes do sentido inverso: num laço (cidade1 == cidade2)
+        # a segunda verificação já encontra a conexão e não duplica a entrada
+        # Estrada repetida apenas atualiza o custo
+        if cidade2 not in self.conexoes[cidade1]:
             self.grafo[cidade1].append(cidade2)
-        if cidade1 not in self.grafo[cidade2]:
+            self._invalidar_caches()
+        self.conexoes[cidade1][cidade2] = custo
+        if cidade1 not in self.conexoes[cidade2]:
             self.grafo[cidade2].append(cidade1)
+            self._invalidar_caches()
+        self.conexoes[cidade2][cidade1] = custo
 
         print(f"✓ Estrada conectada: {cidade1} ↔ {cidade2}")
 
+    def _invalidar_caches(self) -> None:
+        # Descarta as estruturas derivadas do mapa (CSR e tabela de distâncias)
+        self._csr = None
+        self._tabela = None
+
+    def precomputar_distancias(self) -> TabelaDistancias:
+        # Pré-computa distâncias e próximos saltos entre todos os pares de cidades
+        # Enquanto o mapa não for alterado, bfs_caminho_mais_curto consulta a tabela em O(1)
+        # Custo: V buscas BFS na construção e ~6 bytes por par de cidades
+        self._tabela = TabelaDistancias(self.congelar())
+        print(f"✓ Tabela de distâncias pré-computada para {len(self.grafo)} cidades")
+        return self._tabela
+
+    def indice_vizinhanca(self, k: int, cidades: Optional[Iterable[str]] = None) -> IndiceVizinhanca:
+        # Constrói o índice de vizinhança de k saltos (todas as cidades ou só 'cidades', ex.: hubs)
+        # O índice é uma fotografia do mapa atual: reconstrua-o após alterações
+        indice = IndiceVizinhanca(self.congelar(), k, cidades)
+        print(f"✓ Índice de vizinhança (k = {k}) construído para {len(indice.bolas)} cidade(s)")
+        return indice
+
+    def congelar(self) -> GrafoCSR:
+        # Retorna a visão CSR (ids inteiros + arrays compactos) do mapa atual
+        # O dict de listas continua sendo o construtor mutável; o CSR é refeito após alterações
+        if self._csr is None:
+            self._csr = GrafoCSR.de_adjacencias(self.grafo)
+        return self._csr
+
     def exibir_mapa(self) -> None:
         # Exibe todas as conexões do mapa de forma organizada
         print("\n" + "="*70)
@@ -53,10 +107,12 @@ class GrafoCidades:
         print(f"Total de estradas: {total_conexoes}")
         print("="*70 + "\n")
 
-    def bfs_caminho_mais_curto(self, origem: str, destino: str) -> Optional[Tuple[List[str], int]]:
+    def bfs_caminho_mais_curto(self, origem: str, destino: str,
+                               bidirecional: bool = False) -> Optional[Tuple[List[str], int]]:
         # Encontra o caminho mais curto entre duas cidades usando BFS (Busca em Largura)
         # Explora em camadas (nível 1, nível 2, etc) até encontrar o destino
         # Estruturas: Fila (deque) para FIFO, visitados (set) para marcar explorados, pais (dict) para reconstruir caminho
+        # bidirecional=True cresce fronteiras a partir das duas pontas (ver _bfs_bidirecional)
         # Retorna tupla (caminho, distancia) ou None se não houver caminho
 
         # ===== VALIDAÇÕES INICIAIS =====
@@ -70,8 +126,22 @@ class GrafoCidades:
 
         if origem == destino:
             print(f"✓ Origem e destino são a mesma cidade!")
+            self.vertices_visitados = 1
             return ([origem], 0)
 
+        if bidirecional:
+            return self._bfs_bidirecional(origem, destino)
+
+        # ===== CONSULTA À TABELA PRÉ-COMPUTADA (se ainda válida) =====
+        if self._tabela is not None:
+            self.vertices_visitados = 0
+            resultado = self._tabela.caminho(origem, destino)
+            if resultado is None:
+                print(f"\n❌ Não existe caminho entre '{origem}' e '{destino}'")
+            else:
+                print(f"\n✓ Caminho obtido da tabela pré-computada ({resultado[1]} conexão(ões))")
+            return resultado
+
         # ===== INICIALIZAÇÃO DAS ESTRUTURAS =====
 
         # Fila para armazenar as cidades a serem exploradas
@@ -123,6 +193,7 @@ class GrafoCidades:
                     # Distância = número de arestas = número de cidades - 1
                     distancia = len(caminho) - 1
 
+                    self.vertices_visitados = len(visitados)
                     return (caminho, distancia)
 
                 # ===== EXPLORA OS VIZINHOS DA CIDADE ATUAL =====
@@ -146,10 +217,287 @@ class GrafoCidades:
                     print(f"      Novos vizinhos adicionados: {', '.join(vizinhos_nao_visitados)}")
 
         # ===== CAMINHO NÃO ENCONTRADO =====
+        self.vertices_visitados = len(visitados)
         print(f"\n❌ Não existe caminho entre '{origem}' e '{destino}'")
         print("─" * 70)
         return None
 
+    def bfs_0_1(self, origem: str, destino: str) -> Optional[Tuple[List[str], int]]:
+        # BFS 0-1: caminho de MENOR CUSTO quando cada estrada custa 0 ou 1 (pedágio)
+        # Usa um deque como fila de prioridade de dois níveis:
+        # estradas de custo 0 entram na FRENTE, de custo 1 no FINAL
+        # Cada cidade sai do deque em ordem de custo, como no Dijkstra, mas em O(V + E)
+        # Retorna tupla (caminho, custo) ou None se não houver caminho
+
+        # ===== VALIDAÇÕES INICIAIS =====
+        if origem not in self.grafo:
+            print(f"❌ ERRO: Cidade de origem '{origem}' não existe no mapa!")
+            return None
+
+        if destino not in self.grafo:
+            print(f"❌ ERRO: Cidade de destino '{destino}' não existe no mapa!")
+            return None
+
+        # custos: menor custo conhecido até cada cidade
+        custos: Dict[str, int] = {origem: 0}
+        pais: Dict[str, Optional[str]] = {origem: None}
+        finalizadas: Set[str] = set()
+        fila = deque([origem])
+
+        print(f"\n🔍 Iniciando BFS 0-1 de '{origem}' para '{destino}'...")
+
+        while fila:
+            cidade_atual = fila.popleft()
+
+            # Uma cidade pode entrar duas vezes no deque; só a primeira saída vale
+            if cidade_atual in finalizadas:
+                continue
+            finalizadas.add(cidade_atual)
+
+            if cidade_atual == destino:
+                break
+
+            for vizinho, custo in self.conexoes[cidade_atual].items():
+                novo_custo = custos[cidade_atual] + custo
+                if vizinho not in custos or novo_custo < custos[vizinho]:
+                    custos[vizinho] = novo_custo
+                    pais[vizinho] = cidade_atual
+                    if custo == 0:
+                        fila.appendleft(vizinho)
+                    else:
+                        fila.append(vizinho)
+
+        self.vertices_visitados = len(finalizadas)
+
+        # ===== CAMINHO NÃO ENCONTRADO =====
+        if destino not in finalizadas:
+            print(f"❌ Não existe caminho entre '{origem}' e '{destino}'")
+            return None
+
+        # ===== RECONSTRÓI O CAMINHO =====
+        caminho = []
+        atual: Optional[str] = destino
+        while atual is not None:
+            caminho.append(atual)
+            atual = pais[atual]
+        caminho.reverse()
+
+        print(f"✓ Caminho de custo {custos[destino]} encontrado ({len(caminho) - 1} conexão(ões))")
+        return (caminho, custos[destino])
+
+    def bfs_niveis(self, origem: str) -> Iterator[Tuple[int, List[str]]]:
+        # Gera as fronteiras do BFS sob demanda: (0, [origem]), (1, vizinhos), (2, ...), ...
+        # O chamador pode parar a qualquer momento (ex.: "cidades a até 3 conexões")
+        # Não guarda pais: a memória é só a fronteira atual + o conjunto de visitados
+        if origem not in self.grafo:
+            print(f"❌ ERRO: Cidade de origem '{origem}' não existe no mapa!")
+            return
+
+        visitados: Set[str] = {origem}
+        fronteira = [origem]
+        nivel = 0
+
+        while fronteira:
+            yield (nivel, fronteira)
+
+            proxima: List[str] = []
+            for cidade_atual in fronteira:
+                for vizinho in self.grafo[cidade_atual]:
+                    if vizinho not in visitados:
+                        visitados.add(vizinho)
+                        proxima.append(vizinho)
+
+            fronteira = proxima
+            nivel += 1
+
+    def _bfs_bidirecional(self, origem: str, destino: str) -> Optional[Tuple[List[str], int]]:
+        # BFS bidirecional: uma fronteira parte da origem e outra do destino
+        # A cada passo expande o nível inteiro da fronteira MENOR e para quando elas se encontram
+        # Em grafos grandes visita ~2·b^(d/2) cidades em vez de ~b^d da busca unilateral
+        # Supõe origem e destino válidos e diferentes (validados em bfs_caminho_mais_curto)
+
+        # pais/filhos: árvores de busca de cada lado (filhos aponta em direção ao destino)
+        pais: Dict[str, Optional[str]] = {origem: None}
+        filhos: Dict[str, Optional[str]] = {destino: None}
+
+        # dist_*: nível de cada cidade em relação à sua ponta (também marcam os visitados)
+        dist_origem: Dict[str, int] = {origem: 0}
+        dist_destino: Dict[str, int] = {destino: 0}
+
+        fronteira_origem = [origem]
+        fronteira_destino = [destino]
+
+        print(f"\n🔍 Iniciando busca BFS BIDIRECIONAL entre '{origem}' e '{destino}'...")
+        print("─" * 70)
+
+        encontro: Optional[Tuple[str, str]] = None
+
+        # ===== LOOP PRINCIPAL: EXPANDE SEMPRE A MENOR FRONTEIRA =====
+        while fronteira_origem and fronteira_destino and encontro is None:
+            if len(fronteira_origem) <= len(fronteira_destino):
+                lado = "origem"
+                fronteira, arvore, dist, dist_outro = fronteira_origem, pais, dist_origem, dist_destino
+            else:
+                lado = "destino"
+                fronteira, arvore, dist, dist_outro = fronteira_destino, filhos, dist_destino, dist_origem
+
+            print(f"\n📍 Expandindo lado da {lado}: {len(fronteira)} cidade(s)...")
+
+            proxima: List[str] = []
+            melhor = None  # (distância total, cidade deste lado, cidade do outro lado)
+
+            # Processa o nível inteiro antes de decidir, garantindo o caminho mínimo
+            for cidade_atual in fronteira:
+                for vizinho in self.grafo[cidade_atual]:
+                    # ===== AS FRONTEIRAS SE ENCONTRARAM =====
+                    if vizinho in dist_outro:
+                        total = dist[cidade_atual] + 1 + dist_outro[vizinho]
+                        if melhor is None or total < melhor[0]:
+                            melhor = (total, cidade_atual, vizinho)
+                    elif vizinho not in dist:
+                        dist[vizinho] = dist[cidade_atual] + 1
+                        arvore[vizinho] = cidade_atual
+                        proxima.append(vizinho)
+
+            if melhor is not None:
+                _, cidade_lado, cidade_outro = melhor
+                encontro = (cidade_lado, cidade_outro) if lado == "origem" else (cidade_outro, cidade_lado)
+
+            if lado == "origem":
+                fronteira_origem = proxima
+            else:
+                fronteira_destino = proxima
+
+        self.vertices_visitados = len(dist_origem) + len(dist_destino)
+
+        # ===== CAMINHO NÃO ENCONTRADO =====
+        if encontro is None:
+            print(f"\n❌ Não existe caminho entre '{origem}' e '{destino}'")
+            print("─" * 70)
+            return None
+
+        # ===== RECONSTRÓI O CAMINHO PELAS DUAS ÁRVORES =====
+        # encontro = (último do lado da origem, primeiro do lado do destino)
+        caminho = []
+        atual: Optional[str] = encontro[0]
+        while atual is not None:
+            caminho.append(atual)
+            atual = pais[atual]
+        caminho.reverse()
+
+        atual = encontro[1]
+        while atual is not None:
+            caminho.append(atual)
+            atual = filhos[atual]
+
+        print(f"\n✓ FRONTEIRAS SE ENCONTRARAM em {encontro[0]} ↔ {encontro[1]}")
+        print(f"   Cidades visitadas: {self.vertices_visitados}")
+        print("─" * 70)
+
+        return (caminho, len(caminho) - 1)
+
+    def comparar_buscas(self, origem: str, destino: str) -> Optional[Tuple[int, int]]:
+        # Executa a busca unilateral e a bidirecional e compara quantas cidades cada uma visitou
+        # Retorna (visitados unilateral, visitados bidirecional) ou None se não houver caminho
+        resultado = self.bfs_caminho_mais_curto(origem, destino)
+        if resultado is None:
+            return None
+        visitados_unilateral = self.vertices_visitados
+
+        resultado_bi = self.bfs_caminho_mais_curto(origem, destino, bidirecional=True)
+        visitados_bidirecional = self.vertices_visitados
+
+        print("\n" + "="*70)
+        print("COMPARAÇÃO: BFS UNILATERAL vs BIDIRECIONAL")
+        print("="*70)
+        print(f"Distância (unilateral):   {resultado[1]} conexão(ões)")
+        print(f"Distância (bidirecional): {resultado_bi[1]} conexão(ões)")
+        print(f"Cidades visitadas (unilateral):   {visitados_unilateral}")
+        print(f"Cidades visitadas (bidirecional): {visitados_bidirecional}")
+        print("="*70 + "\n")
+
+        return (visitados_unilateral, visitados_bidirecional)
+
+    def contar_caminhos_minimos(self, origem: str, destino: str) -> int:
+        # Quantos caminhos mínimos distintos existem entre duas cidades (0 se não há caminho)
+        return self.congelar().contar_caminhos_minimos(origem, destino)
+
+    def caminhos_minimos(self, origem: str, destino: str,
+                         limite: Optional[int] = None) -> Iterator[List[str]]:
+        # Gera os caminhos mínimos entre duas cidades sob demanda (no máximo 'limite')
+        return self.congelar().caminhos_minimos(origem, destino, limite)
+
+    def bfs_lote(self, pares: Iterable[Tuple[str, str]], workers: int = 1,
+                 origens_por_tarefa: int = 16) -> Iterator[Optional[Tuple[List[str], int]]]:
+        # Resolve muitos pares (origem, destino) sem saída no console
+        # Agrupa os pares por origem: cada origem precisa de apenas UMA árvore BFS (sobre o CSR)
+        # Com workers > 1 as árvores são distribuídas em um ProcessPoolExecutor,
+        # que recebe o grafo uma única vez por processo (initializer)
+        # Cada tarefa leva até origens_por_tarefa origens, e no máximo workers * 4
+        # tarefas ficam em andamento: a memória dos resultados pendentes é limitada
+        # Gera os resultados (caminho, distancia) ou None na MESMA ordem dos pares de entrada
+        if origens_por_tarefa < 1:
+            raise ValueError("origens_por_tarefa deve ser positivo")
+
+        pares = list(pares)
+
+        # grupos: origem → destinos distintos, na ordem da primeira aparição
+        # ultimo: índice do último par de cada origem (libera a memória depois dele)
+        grupos: Dict[str, Dict[str, None]] = {}
+        ultimo: Dict[str, int] = {}
+        for i, (origem, destino) in enumerate(pares):
+            grupos.setdefault(origem, {})[destino] = None
+            ultimo[origem] = i
+
+        csr = self.congelar()
+        resultados: Dict[str, Dict[str, Optional[Tuple[List[str], int]]]] = {}
+
+        if workers <= 1:
+            # Execução no próprio processo: calcula cada árvore quando a origem aparece
+            for i, (origem, destino) in enumerate(pares):
+                if origem not in resultados:
+                    destinos = list(grupos[origem])
+                    resultados[origem] = dict(zip(destinos, csr.caminhos_a_partir_de(origem, destinos)))
+                yield resultados[origem][destino]
+                if ultimo[origem] == i:
+                    del resultados[origem]
+            return
+
+        # Tarefas na ordem da primeira aparição: a origem do próximo par
+        # sempre está na tarefa mais antiga ainda não consumida
+        ordem = list(grupos)
+        tarefas = ([(origem, list(grupos[origem])) for origem in ordem[inicio:inicio + origens_por_tarefa]]
+                   for inicio in range(0, len(ordem), origens_por_tarefa))
+        janela = workers * 4
+
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                   initargs=(csr.nomes, csr.offsets, csr.destinos))
+        futuros: deque = deque()
+        try:
+            def submeter() -> None:
+                # Completa a janela de tarefas em andamento
+                while len(futuros) < janela:
+                    tarefa = next(tarefas, None)
+                    if tarefa is None:
+                        return
+                    futuros.append((tarefa, pool.submit(_resolver_lote, tarefa)))
+
+            submeter()
+            for i, (origem, destino) in enumerate(pares):
+                while origem not in resultados:
+                    tarefa, futuro = futuros.popleft()
+                    for (origem_tarefa, destinos), caminhos in zip(tarefa, futuro.result()):
+                        resultados[origem_tarefa] = dict(zip(destinos, caminhos))
+                    submeter()
+                yield resultados[origem][destino]
+                if ultimo[origem] == i:
+                    del resultados[origem]
+        finally:
+            # Se o chamador parar cedo, cancela as tarefas que ainda não começaram
+            for _, futuro in futuros:
+                futuro.cancel()
+            pool.shutdown()
+
     def exibir_resultado(self, origem: str, destino: str) -> None:
         # Executa o BFS e exibe o resultado formatado com origem, destino e caminho encontrado
         print("\n" + "="*70)
@@ -261,7 +609,8 @@ def menu_principal():
         print("1. Buscar caminho mais curto entre duas cidades")
         print("2. Ver mapa de conexões novamente")
         print("3. Exemplos de buscas pré-definidas")
-        print("4. Sair")
+        print("4. Comparar BFS unilateral vs bidirecional")
+        print("5. Sair")
         print("─"*70)
 
         opcao = input("\nEscolha uma opção: ").strip()
@@ -317,6 +666,11 @@ def menu_principal():
                 mapa.exibir_resultado(origem, destino)
 
         elif opcao == "4":
+            origem = input("\n🚗 Digite o NOME da cidade de ORIGEM: ").strip()
+            destino = input("🎯 Digite o NOME da cidade de DESTINO: ").strip()
+            mapa.comparar_buscas(origem, destino)
+
+        elif opcao == "5":
             print("\n" + "="*70)
             print("Obrigado por usar o Sistema de Navegação BFS!")
             print("="*70 + "\n")
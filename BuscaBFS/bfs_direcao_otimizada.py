@@ -0,0 +1,103 @@
+"""
+BFS com otimização de direção (Beamer, Asanović e Patterson, 2012)
+Problema: BFS completo a partir de um hub, onde os níveis do meio tocam quase todas as estradas
+"""
+
+from array import array
+from typing import Dict, List
+
+from grafo_csr import GrafoCSR
+
+
+class BFSDirecaoOtimizada:
+    # Motor de travessia que alterna entre duas estratégias a cada nível:
+    # - top-down:  cada cidade da fronteira visita seus vizinhos (bom com fronteira pequena)
+    # - bottom-up: cada cidade NÃO visitada procura um pai na fronteira e para no primeiro
+    #              encontrado (bom com fronteira grande, evita checar a mesma estrada várias vezes)
+    # Visitados e fronteira ficam em bytearrays (0/1 por id) em vez de sets de strings
+    # Os níveis produzidos são idênticos aos do BFS tradicional
+
+    def __init__(self, grafo: GrafoCSR, alfa: float = 14.0, beta: float = 24.0) -> None:
+        # alfa: muda para bottom-up quando arestas da fronteira > arestas não exploradas / alfa
+        # beta: volta para top-down quando cidades na fronteira < total de cidades / beta
+        # (valores padrão sugeridos no artigo original)
+        self.grafo = grafo
+        self.alfa = alfa
+        self.beta = beta
+        # passos_*: quantos níveis a última busca processou em cada direção
+        self.passos_top_down = 0
+        self.passos_bottom_up = 0
+
+    def distancias(self, origem_id: int) -> array:
+        # Executa o BFS a partir de origem_id e retorna o nível de cada id (-1 = não alcançado)
+        offsets = self.grafo.offsets
+        destinos = self.grafo.destinos
+        n = self.grafo.num_cidades()
+
+        distancias = array('i', [-1]) * n
+        visitados = bytearray(n)
+        distancias[origem_id] = 0
+        visitados[origem_id] = 1
+
+        fronteira: List[int] = [origem_id]
+        nivel = 0
+
+        # arestas_nao_exploradas: soma dos graus das cidades ainda não visitadas (m_u)
+        arestas_nao_exploradas = len(destinos) - (offsets[origem_id + 1] - offsets[origem_id])
+        bottom_up = False
+        self.passos_top_down = 0
+        self.passos_bottom_up = 0
+
+        while fronteira:
+            nivel += 1
+            arestas_fronteira = sum(offsets[v + 1] - offsets[v] for v in fronteira)
+
+            # ===== HEURÍSTICA DE TROCA DE DIREÇÃO =====
+            if not bottom_up:
+                bottom_up = arestas_fronteira > arestas_nao_exploradas / self.alfa
+            else:
+                bottom_up = len(fronteira) >= n / self.beta
+
+            proxima: List[int] = []
+
+            if bottom_up:
+                # ===== BOTTOM-UP: cidades não visitadas procuram um pai na fronteira =====
+                self.passos_bottom_up += 1
+                na_fronteira = bytearray(n)
+                for v in fronteira:
+                    na_fronteira[v] = 1
+
+                for v in range(n):
+                    if visitados[v]:
+                        continue
+                    for u in destinos[offsets[v]:offsets[v + 1]]:
+                        if na_fronteira[u]:
+                            proxima.append(v)
+                            break
+
+                # Marca depois da varredura para não usar cidades do próprio nível como pai
+                for v in proxima:
+                    visitados[v] = 1
+                    distancias[v] = nivel
+            else:
+                # ===== TOP-DOWN: a fronteira visita seus vizinhos =====
+                self.passos_top_down += 1
+                for u in fronteira:
+                    for v in destinos[offsets[u]:offsets[u + 1]]:
+                        if not visitados[v]:
+                            visitados[v] = 1
+                            distancias[v] = nivel
+                            proxima.append(v)
+
+            for v in proxima:
+                arestas_nao_exploradas -= offsets[v + 1] - offsets[v]
+            fronteira = proxima
+
+        return distancias
+
+    def niveis(self, origem: str) -> Dict[str, int]:
+        # Níveis por nome de cidade (apenas as alcançáveis a partir da origem)
+        if origem not in self.grafo.indices:
+            return {}
+        distancias = self.distancias(self.grafo.indices[origem])
+        return {self.grafo.nomes[i]: d for i, d in enumerate(distancias) if d != -1}
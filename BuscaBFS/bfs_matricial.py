@@ -0,0 +1,84 @@
+"""
+BFS matricial (álgebra linear esparsa) com NumPy/SciPy
+Problema: Relatórios de alcance entre todas as cidades em grafos com 10^5–10^6 vértices
+
+Cada nível do BFS é UM produto matriz esparsa × vetor sobre a matriz de adjacência,
+mascarado pelo vetor de visitados; não há laço Python por vizinho.
+Dependências opcionais: pip install numpy scipy
+"""
+
+from typing import Sequence
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:
+    print("❌ ERRO: Instale as bibliotecas necessárias:")
+    print("   pip install numpy scipy")
+    raise
+
+from grafo_csr import GrafoCSR
+
+
+class BFSMatricial:
+    # Motor de BFS vetorizado sobre a matriz de adjacência esparsa do GrafoCSR
+    # Reaproveita diretamente os arrays offsets/destinos (mesmo formato CSR do SciPy)
+
+    def __init__(self, grafo: GrafoCSR) -> None:
+        n = grafo.num_cidades()
+        indptr = np.frombuffer(grafo.offsets, dtype=np.int64)
+        indices = np.frombuffer(grafo.destinos, dtype=np.int32)
+        dados = np.ones(len(indices), dtype=np.int32)
+
+        self.grafo = grafo
+        # adjacencia: matriz n × n com 1 onde existe estrada (simétrica: grafo não-direcionado)
+        self.adjacencia = sp.csr_matrix((dados, indices, indptr), shape=(n, n))
+
+    def distancias(self, origem_id: int) -> np.ndarray:
+        # Distância em saltos de origem_id até cada cidade (-1 = não alcançada)
+        n = self.adjacencia.shape[0]
+        distancias = np.full(n, -1, dtype=np.int32)
+        visitados = np.zeros(n, dtype=bool)
+
+        fronteira = np.zeros(n, dtype=np.int32)
+        fronteira[origem_id] = 1
+        visitados[origem_id] = True
+        distancias[origem_id] = 0
+        nivel = 0
+
+        while fronteira.any():
+            nivel += 1
+            # Próximo nível = vizinhos da fronteira que ainda não foram visitados
+            alcancados = (self.adjacencia @ fronteira > 0) & ~visitados
+            distancias[alcancados] = nivel
+            visitados |= alcancados
+            fronteira = alcancados.astype(np.int32)
+
+        return distancias
+
+    def matriz_distancias(self, origens: Sequence[int]) -> np.ndarray:
+        # Distâncias de um BLOCO de origens de uma só vez (k × n, -1 = não alcançada)
+        # Cada nível é um único produto matriz esparsa × matriz densa (n × k)
+        n = self.adjacencia.shape[0]
+        origens = np.asarray(origens, dtype=np.int64)
+        k = len(origens)
+        colunas = np.arange(k)
+
+        distancias = np.full((n, k), -1, dtype=np.int32)
+        visitados = np.zeros((n, k), dtype=bool)
+
+        fronteira = np.zeros((n, k), dtype=np.int32)
+        fronteira[origens, colunas] = 1
+        visitados[origens, colunas] = True
+        distancias[origens, colunas] = 0
+        nivel = 0
+
+        while fronteira.any():
+            nivel += 1
+            alcancados = (self.adjacencia @ fronteira > 0) & ~visitados
+            distancias[alcancados] = nivel
+            visitados |= alcancados
+            fronteira = alcancados.astype(np.int32)
+
+        # Uma linha por origem, como em distancias()
+        return distancias.T.copy()
@@ -0,0 +1,235 @@
+"""
+Representação CSR (Compressed Sparse Row) do mapa de cidades
+Problema: Rodar o BFS em grafos com milhões de estradas usando ids inteiros
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Grafo carregado uma única vez em cada processo do pool (ver bfs_lote em bfs_cidades.py)
+_grafo_worker: Optional['GrafoCSR'] = None
+
+
+class GrafoCSR:
+    # Visão congelada (somente leitura) de um grafo de cidades
+    # Cada cidade recebe um id inteiro contíguo (0, 1, 2, ...)
+    # Os vizinhos da cidade i são destinos[offsets[i]:offsets[i+1]]
+    # Strings só aparecem na entrada (nome → id) e na saída (caminho final)
+
+    def __init__(self, nomes: List[str], offsets: array, destinos: array) -> None:
+        # nomes: id → nome da cidade
+        # indices: nome da cidade → id
+        # offsets: início da lista de vizinhos de cada id (tamanho V + 1)
+        # destinos: todos os vizinhos concatenados (tamanho 2E no grafo não-direcionado)
+        self.nomes: List[str] = nomes
+        self.indices: Dict[str, int] = {nome: i for i, nome in enumerate(nomes)}
+        self.offsets: array = offsets
+        self.destinos: array = destinos
+
+    @classmethod
+    def de_adjacencias(cls, grafo: Dict[str, List[str]]) -> 'GrafoCSR':
+        # Constrói o CSR a partir de uma lista de adjacências (dict de listas)
+        # Os ids seguem a ordem de inserção do dicionário e os vizinhos mantêm sua ordem
+        nomes = list(grafo.keys())
+        indices = {nome: i for i, nome in enumerate(nomes)}
+
+        # 'q' (64 bits) nos offsets comporta mais de 2^31 entradas de adjacência
+        offsets = array('q', [0])
+        destinos = array('i')
+
+        for nome in nomes:
+            destinos.extend(indices[vizinho] for vizinho in grafo[nome])
+            offsets.append(len(destinos))
+
+        return cls(nomes, offsets, destinos)
+
+    def num_cidades(self) -> int:
+        # Número de vértices
+        return len(self.nomes)
+
+    def num_estradas(self) -> int:
+        # Número de arestas: cada estrada aparece duas vezes em destinos,
+        # exceto os laços (cidade ligada a ela mesma), que aparecem uma vez
+        offsets, destinos = self.offsets, self.destinos
+        lacos = sum(1 for i in range(len(self.nomes)) if i in destinos[offsets[i]:offsets[i + 1]])
+        return (len(destinos) + lacos) // 2
+
+    def vizinhos(self, cidade_id: int) -> array:
+        # Vizinhos de uma cidade como fatia do array de destinos
+        return self.destinos[self.offsets[cidade_id]:self.offsets[cidade_id + 1]]
+
+    def bfs_arvore(self, origem_id: int, destino_id: int = -1) -> Tuple[array, array]:
+        # BFS sobre ids inteiros a partir de origem_id
+        # Retorna (distancias, pais): arrays indexados por id, -1 = não alcançado
+        # Se destino_id for informado, para assim que ele é descoberto
+        n = len(self.nomes)
+        offsets = self.offsets
+        destinos = self.destinos
+
+        distancias = array('i', [-1]) * n
+        pais = array('i', [-1]) * n
+        distancias[origem_id] = 0
+
+        # Fila como array + ponteiro de leitura: mais compacta que um deque de objetos
+        fila = array('i', [origem_id])
+        inicio = 0
+
+        while inicio < len(fila):
+            atual = fila[inicio]
+            inicio += 1
+            proxima_distancia = distancias[atual] + 1
+
+            for vizinho in destinos[offsets[atual]:offsets[atual + 1]]:
+                if distancias[vizinho] == -1:
+                    distancias[vizinho] = proxima_distancia
+                    pais[vizinho] = atual
+                    if vizinho == destino_id:
+                        return distancias, pais
+                    fila.append(vizinho)
+
+        return distancias, pais
+
+    def caminho_da_arvore(self, pais: array, destino_id: int) -> List[str]:
+        # Reconstrói o caminho origem → destino seguindo os pais e só então converte ids em nomes
+        ids = []
+        atual = destino_id
+        while atual != -1:
+            ids.append(atual)
+            atual = pais[atual]
+        ids.reverse()
+        return [self.nomes[i] for i in ids]
+
+    def bfs_caminho_mais_curto(self, origem: str, destino: str) -> Optional[Tuple[List[str], int]]:
+        # Mesmo contrato de GrafoCidades.bfs_caminho_mais_curto, mas sem saída no console
+        # Retorna tupla (caminho, distancia) ou None se não houver caminho
+        if origem not in self.indices or destino not in self.indices:
+            return None
+
+        origem_id = self.indices[origem]
+        destino_id = self.indices[destino]
+
+        if origem_id == destino_id:
+            return ([origem], 0)
+
+        distancias, pais = self.bfs_arvore(origem_id, destino_id)
+
+        if distancias[destino_id] == -1:
+            return None
+
+        return (self.caminho_da_arvore(pais, destino_id), distancias[destino_id])
+
+    def bfs_contagem(self, origem_id: int, destino_id: int) -> Tuple[array, List[int]]:
+        # BFS que também conta quantos caminhos mínimos chegam a cada cidade
+        # contagens[v] = soma das contagens dos predecessores de v no DAG de caminhos mínimos
+        # (predecessor = vizinho com distância exatamente uma unidade menor)
+        # Inteiros Python: a contagem pode crescer exponencialmente sem estourar
+        # Para ao terminar o nível do destino: níveis além dele não afetam a contagem
+        n = len(self.nomes)
+        offsets = self.offsets
+        destinos = self.destinos
+
+        distancias = array('i', [-1]) * n
+        contagens = [0] * n
+        distancias[origem_id] = 0
+        contagens[origem_id] = 1
+
+        fila = array('i', [origem_id])
+        inicio = 0
+
+        while inicio < len(fila):
+            atual = fila[inicio]
+            inicio += 1
+            if distancias[destino_id] != -1 and distancias[atual] >= distancias[destino_id]:
+                break
+            proxima_distancia = distancias[atual] + 1
+
+            for vizinho in destinos[offsets[atual]:offsets[atual + 1]]:
+                if distancias[vizinho] == -1:
+                    distancias[vizinho] = proxima_distancia
+                    fila.append(vizinho)
+                if distancias[vizinho] == proxima_distancia:
+                    contagens[vizinho] += contagens[atual]
+
+        return distancias, contagens
+
+    def contar_caminhos_minimos(self, origem: str, destino: str) -> int:
+        # Número de caminhos mínimos distintos entre duas cidades em O(V + E) (0 se não há caminho)
+        if origem not in self.indices or destino not in self.indices:
+            return 0
+        _, contagens = self.bfs_contagem(self.indices[origem], self.indices[destino])
+        return contagens[self.indices[destino]]
+
+    def caminhos_minimos(self, origem: str, destino: str,
+                         limite: Optional[int] = None) -> Iterator[List[str]]:
+        # Gera TODOS os caminhos mínimos entre duas cidades, sob demanda (até 'limite' caminhos)
+        # Percorre o DAG de caminhos mínimos de trás para frente (destino → origem) com pilha
+        # explícita de iteradores: todo ramo chega à origem, então não há trabalho desperdiçado
+        if origem not in self.indices or destino not in self.indices:
+            return
+        origem_id = self.indices[origem]
+        destino_id = self.indices[destino]
+
+        distancias, _ = self.bfs_contagem(origem_id, destino_id)
+        if distancias[destino_id] == -1:
+            return
+
+        offsets = self.offsets
+        destinos = self.destinos
+
+        def predecessores(v: int) -> Iterator[int]:
+            # Predecessores de v no DAG, calculados sob demanda a partir das distâncias
+            alvo = distancias[v] - 1
+            return (u for u in destinos[offsets[v]:offsets[v + 1]] if distancias[u] == alvo)
+
+        gerados = 0
+        caminho = [destino_id]  # caminho parcial, do destino em direção à origem
+        pilha = [predecessores(destino_id)]
+
+        while pilha:
+            if limite is not None and gerados >= limite:
+                return
+
+            if caminho[-1] == origem_id:
+                yield [self.nomes[i] for i in reversed(caminho)]
+                gerados += 1
+                pilha.pop()
+                caminho.pop()
+                continue
+
+            proximo = next(pilha[-1], None)
+            if proximo is None:
+                pilha.pop()
+                caminho.pop()
+            else:
+                caminho.append(proximo)
+                pilha.append(predecessores(proximo))
+
+    def caminhos_a_partir_de(self, origem: str, destinos: List[str]) -> List[Optional[Tuple[List[str], int]]]:
+        # Resolve vários destinos com UMA única árvore BFS a partir da origem
+        # Retorna uma lista alinhada com 'destinos' (None onde não há caminho)
+        if origem not in self.indices:
+            return [None] * len(destinos)
+
+        distancias, pais = self.bfs_arvore(self.indices[origem])
+        resultados: List[Optional[Tuple[List[str], int]]] = []
+
+        for destino in destinos:
+            destino_id = self.indices.get(destino, -1)
+            if destino_id == -1 or distancias[destino_id] == -1:
+                resultados.append(None)
+            else:
+                resultados.append((self.caminho_da_arvore(pais, destino_id), distancias[destino_id]))
+
+        return resultados
+
+
+def _inicializar_worker(nomes: List[str], offsets: array, destinos: array) -> None:
+    # Executado uma vez por processo: monta o GrafoCSR local do worker
+    global _grafo_worker
+    _grafo_worker = GrafoCSR(nomes, offsets, destinos)
+
+
+def _resolver_lote(tarefas: List[Tuple[str, List[str]]]) -> List[List[Optional[Tuple[List[str], int]]]]:
+    # Tarefa enviada ao pool: várias origens por vez, uma árvore BFS por origem
+    # Retorna uma lista alinhada com 'tarefas'
+    return [_grafo_worker.caminhos_a_partir_de(origem, destinos) for origem, destinos in tarefas]
@@ -0,0 +1,131 @@
+"""
+Índice de vizinhança de k saltos
+Problema: Responder "quais cidades estão a até N conexões de X" sem repetir o BFS
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from grafo_csr import GrafoCSR
+
+
+class IndiceVizinhanca:
+    # Para cada cidade indexada guarda a "bola" de raio k: todas as cidades a até k saltos
+    # Cada bola é um par de arrays alinhados e ordenados por id:
+    # - ids ('i'): ids das cidades da bola (inclui a própria cidade, a distância 0)
+    # - distancias ('B'): saltos até cada uma (k ≤ 255)
+    # Consultas viram busca binária ou interseção de arrays ordenados
+
+    def __init__(self, grafo: GrafoCSR, k: int, cidades: Optional[Iterable[str]] = None) -> None:
+        # k: raio máximo indexado
+        # cidades: constrói apenas para estas cidades (ex.: hubs); None = todas
+        if not 0 <= k <= 255:
+            raise ValueError("k deve estar entre 0 e 255")
+
+        self.grafo = grafo
+        self.k = k
+        self.bolas: Dict[int, Tuple[array, array]] = {}
+
+        if cidades is None:
+            ids = range(grafo.num_cidades())
+        else:
+            ids = [grafo.indices[c] for c in cidades if c in grafo.indices]
+
+        for cidade_id in ids:
+            self.bolas[cidade_id] = self._construir_bola(cidade_id)
+
+    def _construir_bola(self, origem_id: int) -> Tuple[array, array]:
+        # BFS truncado em k saltos a partir de origem_id
+        offsets = self.grafo.offsets
+        destinos = self.grafo.destinos
+
+        distancia: Dict[int, int] = {origem_id: 0}
+        fronteira = [origem_id]
+
+        for nivel in range(1, self.k + 1):
+            proxima = []
+            for atual in fronteira:
+                for vizinho in destinos[offsets[atual]:offsets[atual + 1]]:
+                    if vizinho not in distancia:
+                        distancia[vizinho] = nivel
+                        proxima.append(vizinho)
+            if not proxima:
+                break
+            fronteira = proxima
+
+        ordenados = sorted(distancia)
+        return array('i', ordenados), array('B', (distancia[i] for i in ordenados))
+
+    def _bola(self, cidade: str) -> Optional[Tuple[array, array]]:
+        # Bola da cidade, ou None se ela não existe ou não foi indexada
+        cidade_id = self.grafo.indices.get(cidade)
+        return self.bolas.get(cidade_id)
+
+    def _raio(self, n: Optional[int]) -> int:
+        # Valida o raio da consulta (não pode passar do k indexado)
+        if n is None:
+            return self.k
+        if n > self.k:
+            raise ValueError(f"Índice construído para k={self.k}, consulta pediu {n}")
+        return n
+
+    def vizinhanca(self, cidade: str, n: Optional[int] = None) -> Optional[List[str]]:
+        # Cidades a até n conexões (n ≤ k) de 'cidade', sem incluir a própria cidade
+        # Retorna None se a cidade não estiver indexada
+        bola = self._bola(cidade)
+        if bola is None:
+            return None
+        n = self._raio(n)
+        ids, distancias = bola
+        return [self.grafo.nomes[i] for i, d in zip(ids, distancias) if 0 < d <= n]
+
+    def dentro_de(self, origem: str, destino: str, n: Optional[int] = None) -> bool:
+        # True se destino está a até n conexões de origem: busca binária O(log |bola|)
+        bola = self._bola(origem)
+        destino_id = self.grafo.indices.get(destino)
+        if bola is None or destino_id is None:
+            return False
+        n = self._raio(n)
+        ids, distancias = bola
+        posicao = bisect_left(ids, destino_id)
+        return posicao < len(ids) and ids[posicao] == destino_id and distancias[posicao] <= n
+
+    def em_comum(self, cidade1: str, cidade2: str, n: Optional[int] = None) -> Optional[List[str]]:
+        # Cidades a até n conexões de AMBAS: interseção de duas bolas ordenadas em O(|b1| + |b2|)
+        bola1 = self._bola(cidade1)
+        bola2 = self._bola(cidade2)
+        if bola1 is None or bola2 is None:
+            return None
+        n = self._raio(n)
+        (ids1, dist1), (ids2, dist2) = bola1, bola2
+
+        comuns = []
+        i = j = 0
+        while i < len(ids1) and j < len(ids2):
+            if ids1[i] < ids2[j]:
+                i += 1
+            elif ids1[i] > ids2[j]:
+                j += 1
+            else:
+                if dist1[i] <= n and dist2[j] <= n:
+                    comuns.append(self.grafo.nomes[ids1[i]])
+                i += 1
+                j += 1
+        return comuns
+
+    def memoria_bytes(self) -> int:
+        # Bytes ocupados pelos arrays das bolas (sem o overhead dos objetos Python)
+        return sum(ids.itemsize * len(ids) + dist.itemsize * len(dist)
+                   for ids, dist in self.bolas.values())
+
+    def exibir_memoria(self) -> None:
+        # Resumo do tamanho do índice
+        total_entradas = sum(len(ids) for ids, _ in self.bolas.values())
+        print("\n" + "="*70)
+        print(f"ÍNDICE DE VIZINHANÇA (k = {self.k})")
+        print("="*70)
+        print(f"Cidades indexadas: {len(self.bolas)} de {self.grafo.num_cidades()}")
+        print(f"Entradas nas bolas: {total_entradas}")
+        print(f"Memória dos arrays: {self.memoria_bytes()} bytes")
+        print("="*70 + "\n")
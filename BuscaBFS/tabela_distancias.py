@@ -0,0 +1,61 @@
+"""
+Tabela pré-computada de distâncias entre todos os pares de cidades
+Problema: Responder consultas repetidas de distância/caminho em O(1) por par
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+from grafo_csr import GrafoCSR
+
+# Valor usado na tabela para pares sem caminho (maior valor de um uint16)
+INALCANCAVEL = 0xFFFF
+
+
+class TabelaDistancias:
+    # Matrizes n × n armazenadas linha a linha em arrays compactos:
+    # - distancias[u*n + v]: saltos de u até v em uint16 ('H'), INALCANCAVEL se não há caminho
+    # - proximos[u*n + v]: id do próximo salto de u em direção a v (-1 se não há)
+    # Um caminho é reconstruído seguindo os próximos saltos, sem rodar BFS
+    # Memória: 2 bytes (distância) + 4 bytes (próximo salto) por par
+
+    def __init__(self, grafo: GrafoCSR) -> None:
+        n = grafo.num_cidades()
+        self.grafo = grafo
+        self.distancias = array('H', [INALCANCAVEL]) * (n * n)
+        self.proximos = array('i', [-1]) * (n * n)
+
+        # Um BFS por cidade v: no grafo não-direcionado, o pai de u na árvore enraizada
+        # em v é exatamente o próximo salto de u em direção a v
+        for v in range(n):
+            distancias_v, pais_v = grafo.bfs_arvore(v)
+            for u in range(n):
+                if distancias_v[u] != -1:
+                    self.distancias[u * n + v] = distancias_v[u]
+                    self.proximos[u * n + v] = pais_v[u]
+
+    def distancia(self, origem: str, destino: str) -> Optional[int]:
+        # Distância em saltos entre duas cidades em O(1), None se não há caminho
+        indices = self.grafo.indices
+        if origem not in indices or destino not in indices:
+            return None
+        distancia = self.distancias[indices[origem] * len(indices) + indices[destino]]
+        return None if distancia == INALCANCAVEL else distancia
+
+    def caminho(self, origem: str, destino: str) -> Optional[Tuple[List[str], int]]:
+        # Reconstrói o caminho seguindo os próximos saltos: O(tamanho do caminho)
+        # Retorna tupla (caminho, distancia) ou None se não houver caminho
+        distancia = self.distancia(origem, destino)
+        if distancia is None:
+            return None
+
+        n = self.grafo.num_cidades()
+        atual = self.grafo.indices[origem]
+        destino_id = self.grafo.indices[destino]
+        caminho = [origem]
+
+        while atual != destino_id:
+            atual = self.proximos[atual * n + destino_id]
+            caminho.append(self.grafo.nomes[atual])
+
+        return (caminho, distancia)
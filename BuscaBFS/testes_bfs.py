@@ -1,6 +1,7 @@
 # Testes automatizados para validar o algoritmo BFS
 
 from bfs_cidades import GrafoCidades, criar_mapa_brasil
+from bfs_direcao_otimizada import BFSDirecaoOtimizada
 
 
 def teste_caminho_existe():
@@ -226,6 +227,476 @@ def teste_bidirecionalidade():
     return sucesso == total
 
 
+def teste_bfs_bidirecional():
+    # Verifica se o BFS bidirecional encontra as mesmas distâncias que o unilateral
+    print("\n" + "="*70)
+    print("TESTE 8: BFS Bidirecional")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    cidades = sorted(mapa.grafo.keys())
+
+    sucesso = 0
+    total = 0
+
+    for origem in cidades:
+        for destino in cidades:
+            total += 1
+            unilateral = mapa.bfs_caminho_mais_curto(origem, destino)
+            bidirecional = mapa.bfs_caminho_mais_curto(origem, destino, bidirecional=True)
+
+            caminho, distancia = bidirecional
+            caminho_valido = (
+                caminho[0] == origem and caminho[-1] == destino and
+                all(caminho[i+1] in mapa.grafo[caminho[i]] for i in range(len(caminho) - 1))
+            )
+
+            if distancia == unilateral[1] and caminho_valido:
+                sucesso += 1
+            else:
+                print(f"✗ FALHOU: {origem} → {destino} (bidirecional: {distancia}, unilateral: {unilateral[1]})")
+
+    # Grafo desconexo também deve retornar None
+    desconexo = GrafoCidades()
+    desconexo.adicionar_estrada("A", "B")
+    desconexo.adicionar_estrada("X", "Y")
+    total += 1
+    if desconexo.bfs_caminho_mais_curto("A", "Y", bidirecional=True) is None:
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Encontrou caminho em grafo desconexo")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_grafo_csr():
+    # Verifica se o BFS sobre o CSR (ids inteiros) concorda com o BFS original
+    print("\n" + "="*70)
+    print("TESTE 9: Grafo CSR")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    csr = mapa.congelar()
+    cidades = sorted(mapa.grafo.keys())
+
+    sucesso = 0
+    total = 2
+
+    num_estradas = sum(len(v) for v in mapa.grafo.values()) // 2
+    if csr.num_cidades() == len(mapa.grafo) and csr.num_estradas() == num_estradas:
+        print(f"✓ PASSOU: CSR com {csr.num_cidades()} cidades e {csr.num_estradas()} estradas")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Tamanho do CSR diferente do mapa")
+
+    divergencias = 0
+    for origem in cidades:
+        for destino in cidades:
+            esperado = mapa.bfs_caminho_mais_curto(origem, destino)
+            obtido = csr.bfs_caminho_mais_curto(origem, destino)
+            if obtido is None or obtido[1] != esperado[1] or obtido[0][-1] != destino:
+                divergencias += 1
+
+    # Cidades inexistentes e alterações posteriores ao congelamento
+    if csr.bfs_caminho_mais_curto("Cidade Falsa", "São Paulo") is not None:
+        divergencias += 1
+    mapa.adicionar_estrada("São Paulo", "Manaus")
+    if mapa.congelar().bfs_caminho_mais_curto("São Paulo", "Manaus")[1] != 1:
+        divergencias += 1
+
+    if divergencias == 0:
+        print("✓ PASSOU: Distâncias do CSR iguais às do BFS original")
+        sucesso += 1
+    else:
+        print(f"✗ FALHOU: {divergencias} divergência(s) entre CSR e BFS original")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_bfs_lote():
+    # Verifica se o BFS em lote (sequencial e com processos) mantém ordem e distâncias
+    print("\n" + "="*70)
+    print("TESTE 10: BFS em Lote")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    cidades = sorted(mapa.grafo.keys())
+
+    pares = [(origem, destino) for destino in cidades for origem in cidades]
+    pares.append(("Cidade Falsa", "São Paulo"))
+    pares.append(("São Paulo", "Cidade Falsa"))
+
+    esperado = []
+    for origem, destino in pares:
+        resultado = mapa.bfs_caminho_mais_curto(origem, destino)
+        esperado.append(resultado[1] if resultado else None)
+
+    sucesso = 0
+    total = 3
+
+    # origens_por_tarefa=1 gera mais tarefas que a janela de workers * 4
+    for workers, origens_por_tarefa in ((1, 16), (2, 16), (2, 1)):
+        obtido = [r[1] if r else None
+                  for r in mapa.bfs_lote(pares, workers=workers, origens_por_tarefa=origens_por_tarefa)]
+        if obtido == esperado:
+            print(f"✓ PASSOU: {len(pares)} pares com workers={workers}, "
+                  f"origens_por_tarefa={origens_por_tarefa}")
+            sucesso += 1
+        else:
+            print(f"✗ FALHOU: Resultados divergentes com workers={workers}, "
+                  f"origens_por_tarefa={origens_por_tarefa}")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_bfs_direcao_otimizada():
+    # Verifica se o BFS com troca top-down/bottom-up produz os mesmos níveis do BFS tradicional
+    print("\n" + "="*70)
+    print("TESTE 11: BFS com Otimização de Direção")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    mapa.adicionar_estrada("Ilha A", "Ilha B")  # componente isolada
+    csr = mapa.congelar()
+
+    # Parâmetros padrão, sempre bottom-up (alfa alto, beta baixo) e sempre top-down (alfa baixo)
+    configuracoes = [(14.0, 24.0), (1e9, 1e-9), (1e-9, 24.0)]
+
+    sucesso = 0
+    total = len(configuracoes)
+
+    for alfa, beta in configuracoes:
+        motor = BFSDirecaoOtimizada(csr, alfa=alfa, beta=beta)
+        iguais = all(
+            motor.distancias(origem) == csr.bfs_arvore(origem)[0]
+            for origem in range(csr.num_cidades())
+        )
+        if iguais:
+            print(f"✓ PASSOU: alfa={alfa:g}, beta={beta:g} "
+                  f"(top-down: {motor.passos_top_down}, bottom-up: {motor.passos_bottom_up})")
+            sucesso += 1
+        else:
+            print(f"✗ FALHOU: Níveis divergentes com alfa={alfa:g}, beta={beta:g}")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_bfs_matricial():
+    # Verifica se o BFS por produto de matriz esparsa produz as mesmas distâncias
+    print("\n" + "="*70)
+    print("TESTE 12: BFS Matricial (NumPy/SciPy)")
+    print("="*70)
+
+    try:
+        from bfs_matricial import BFSMatricial
+    except ImportError:
+        print("⚠️  numpy/scipy não instalados - teste ignorado")
+        return True
+
+    mapa = criar_mapa_brasil()
+    mapa.adicionar_estrada("Ilha A", "Ilha B")  # componente isolada
+    csr = mapa.congelar()
+    motor = BFSMatricial(csr)
+    origens = list(range(csr.num_cidades()))
+
+    sucesso = 0
+    total = 2
+
+    if all(list(motor.distancias(o)) == list(csr.bfs_arvore(o)[0]) for o in origens):
+        print("✓ PASSOU: Distâncias de origem única iguais ao BFS tradicional")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Distâncias de origem única divergentes")
+
+    matriz = motor.matriz_distancias(origens)
+    if all(list(matriz[i]) == list(csr.bfs_arvore(o)[0]) for i, o in enumerate(origens)):
+        print(f"✓ PASSOU: Matriz de distâncias {matriz.shape[0]}×{matriz.shape[1]} correta")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Matriz de distâncias divergente")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_tabela_distancias():
+    # Verifica a tabela pré-computada de distâncias e sua invalidação após alterações
+    print("\n" + "="*70)
+    print("TESTE 13: Tabela de Distâncias Pré-computada")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    mapa.adicionar_estrada("Ilha A", "Ilha B")  # componente isolada
+    cidades = sorted(mapa.grafo.keys())
+
+    esperado = {}
+    for origem in cidades:
+        for destino in cidades:
+            resultado = mapa.bfs_caminho_mais_curto(origem, destino)
+            esperado[(origem, destino)] = resultado[1] if resultado else None
+
+    mapa.precomputar_distancias()
+
+    sucesso = 0
+    total = 2
+
+    divergencias = 0
+    for (origem, destino), distancia in esperado.items():
+        resultado = mapa.bfs_caminho_mais_curto(origem, destino)
+        if distancia is None:
+            divergencias += resultado is not None
+            continue
+        caminho, obtida = resultado
+        caminho_valido = (
+            caminho[0] == origem and caminho[-1] == destino and len(caminho) == obtida + 1 and
+            all(caminho[i+1] in mapa.grafo[caminho[i]] for i in range(len(caminho) - 1))
+        )
+        divergencias += not (obtida == distancia and caminho_valido)
+
+    if divergencias == 0:
+        print("✓ PASSOU: Tabela concorda com o BFS para todos os pares")
+        sucesso += 1
+    else:
+        print(f"✗ FALHOU: {divergencias} par(es) divergente(s)")
+
+    # Uma nova estrada invalida a tabela: o BFS volta a ser usado
+    mapa.adicionar_estrada("Ilha A", "São Paulo")
+    resultado = mapa.bfs_caminho_mais_curto("Ilha B", "São Paulo")
+    if resultado and resultado[1] == 2 and mapa.vertices_visitados > 0:
+        print("✓ PASSOU: Tabela invalidada após adicionar estrada")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Tabela não foi invalidada após alteração")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_bfs_niveis():
+    # Verifica o gerador de níveis do BFS e a parada antecipada
+    print("\n" + "="*70)
+    print("TESTE 14: Gerador de Níveis do BFS")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    csr = mapa.congelar()
+
+    sucesso = 0
+    total = 3
+
+    # Os níveis gerados devem coincidir com as distâncias do BFS
+    distancias = csr.bfs_arvore(csr.indices["São Paulo"])[0]
+    niveis_ok = True
+    vistos = 0
+    for nivel, cidades in mapa.bfs_niveis("São Paulo"):
+        vistos += len(cidades)
+        niveis_ok &= all(distancias[csr.indices[c]] == nivel for c in cidades)
+
+    if niveis_ok and vistos == len(mapa.grafo):
+        print("✓ PASSOU: Níveis iguais às distâncias do BFS")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Níveis divergentes")
+
+    # Parada antecipada: cidades a até 1 conexão de São Paulo
+    ate_1 = set()
+    for nivel, cidades in mapa.bfs_niveis("São Paulo"):
+        if nivel > 1:
+            break
+        ate_1.update(cidades)
+
+    if ate_1 == {"São Paulo"} | set(mapa.grafo["São Paulo"]):
+        print(f"✓ PASSOU: {len(ate_1)} cidades a até 1 conexão de São Paulo")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Parada antecipada incorreta")
+
+    if list(mapa.bfs_niveis("Cidade Falsa")) == []:
+        print("✓ PASSOU: Cidade inexistente não gera níveis")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Cidade inexistente gerou níveis")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_indice_vizinhanca():
+    # Verifica o índice de vizinhança de k saltos contra o gerador de níveis
+    print("\n" + "="*70)
+    print("TESTE 15: Índice de Vizinhança (k saltos)")
+    print("="*70)
+
+    mapa = criar_mapa_brasil()
+    indice = mapa.indice_vizinhanca(3)
+    cidades = sorted(mapa.grafo.keys())
+
+    sucesso = 0
+    total = 4
+
+    # Bola de raio n obtida pelo BFS em níveis, para comparação
+    def bola(cidade, n):
+        resultado = set()
+        for nivel, fronteira in mapa.bfs_niveis(cidade):
+            if nivel > n:
+                break
+            resultado.update(fronteira)
+        return resultado - {cidade}
+
+    if all(set(indice.vizinhanca(c, n)) == bola(c, n) for c in cidades for n in range(4)):
+        print("✓ PASSOU: Vizinhanças iguais às do BFS para n = 0..3")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Vizinhanças divergentes")
+
+    dentro_ok = all(
+        indice.dentro_de(a, b, 2) == (b in bola(a, 2) or a == b)
+        for a in cidades for b in cidades
+    )
+    comum_ok = set(indice.em_comum("São Paulo", "Salvador", 2)) == (
+        (bola("São Paulo", 2) | {"São Paulo"}) & (bola("Salvador", 2) | {"Salvador"})
+    )
+    if dentro_ok and comum_ok:
+        print("✓ PASSOU: Consultas dentro_de e em_comum corretas")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Consultas dentro_de/em_comum incorretas")
+
+    hubs = mapa.indice_vizinhanca(2, ["São Paulo", "Brasília"])
+    if len(hubs.bolas) == 2 and hubs.vizinhanca("Manaus") is None and hubs.memoria_bytes() < indice.memoria_bytes():
+        print(f"✓ PASSOU: Índice só de hubs ({hubs.memoria_bytes()} bytes vs {indice.memoria_bytes()} bytes)")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Índice de hubs incorreto")
+
+    try:
+        indice.vizinhanca("São Paulo", 4)
+        print("✗ FALHOU: Consulta acima de k deveria gerar erro")
+    except ValueError:
+        print("✓ PASSOU: Consulta acima de k rejeitada")
+        sucesso += 1
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_caminhos_minimos():
+    # Verifica a contagem e a enumeração de todos os caminhos mínimos
+    print("\n" + "="*70)
+    print("TESTE 16: Contagem e Enumeração de Caminhos Mínimos")
+    print("="*70)
+
+    sucesso = 0
+    total = 3
+
+    # Losango do TESTE 4: A → G tem 3 caminhos mínimos (A-B-E-G, A-C-E-G, A-C-F-G)
+    mapa = GrafoCidades()
+    for c1, c2 in [("A", "B"), ("A", "C"), ("B", "D"), ("B", "E"),
+                   ("C", "E"), ("C", "F"), ("E", "G"), ("F", "G")]:
+        mapa.adicionar_estrada(c1, c2)
+
+    caminhos = sorted(mapa.caminhos_minimos("A", "G"))
+    esperados = [["A", "B", "E", "G"], ["A", "C", "E", "G"], ["A", "C", "F", "G"]]
+    if mapa.contar_caminhos_minimos("A", "G") == 3 and caminhos == esperados:
+        print("✓ PASSOU: 3 caminhos mínimos de A até G")
+        sucesso += 1
+    else:
+        print(f"✗ FALHOU: Caminhos obtidos: {caminhos}")
+
+    # Cadeia de 60 losangos: 2^60 caminhos mínimos, contados e enumerados sem explosão
+    cadeia = GrafoCidades()
+    for i in range(60):
+        cadeia.adicionar_estrada(f"V{i}", f"S{i}")
+        cadeia.adicionar_estrada(f"V{i}", f"I{i}")
+        cadeia.adicionar_estrada(f"S{i}", f"V{i+1}")
+        cadeia.adicionar_estrada(f"I{i}", f"V{i+1}")
+
+    limitados = list(cadeia.caminhos_minimos("V0", "V60", limite=5))
+    if (cadeia.contar_caminhos_minimos("V0", "V60") == 2 ** 60 and len(limitados) == 5 and
+            len(set(map(tuple, limitados))) == 5 and all(len(c) == 121 for c in limitados)):
+        print("✓ PASSOU: 2^60 caminhos contados; 5 primeiros enumerados com limite")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Contagem/enumeração na cadeia de losangos")
+
+    mapa_brasil = criar_mapa_brasil()
+    resultado = mapa_brasil.bfs_caminho_mais_curto("Manaus", "Porto Alegre")
+    todos = list(mapa_brasil.caminhos_minimos("Manaus", "Porto Alegre"))
+    if (len(todos) == mapa_brasil.contar_caminhos_minimos("Manaus", "Porto Alegre") and
+            resultado[0] in todos and all(len(c) - 1 == resultado[1] for c in todos) and
+            mapa_brasil.contar_caminhos_minimos("Manaus", "Cidade Falsa") == 0):
+        print(f"✓ PASSOU: {len(todos)} caminho(s) mínimo(s) Manaus → Porto Alegre")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Enumeração no mapa do Brasil")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
+def teste_bfs_0_1():
+    # Verifica o BFS 0-1 em estradas com e sem pedágio
+    print("\n" + "="*70)
+    print("TESTE 17: BFS 0-1 (estradas com custo 0 ou 1)")
+    print("="*70)
+
+    sucesso = 0
+    total = 4
+
+    # A-B-C-D sem pedágio (custo 0) é mais barato que o atalho A-D com pedágio
+    mapa = GrafoCidades()
+    mapa.adicionar_estrada("A", "B", 0)
+    mapa.adicionar_estrada("B", "C", 0)
+    mapa.adicionar_estrada("C", "D", 0)
+    mapa.adicionar_estrada("A", "D", 1)
+    mapa.adicionar_estrada("D", "E", 1)
+
+    resultado = mapa.bfs_0_1("A", "E")
+    if resultado == (["A", "B", "C", "D", "E"], 1) and mapa.bfs_caminho_mais_curto("A", "E")[1] == 2:
+        print("✓ PASSOU: Prefere 3 estradas sem pedágio ao atalho com pedágio")
+        sucesso += 1
+    else:
+        print(f"✗ FALHOU: Resultado inesperado {resultado}")
+
+    # Com todas as estradas de custo 1, o custo é a distância do BFS comum
+    mapa_brasil = criar_mapa_brasil()
+    cidades = sorted(mapa_brasil.grafo.keys())
+    iguais = all(
+        mapa_brasil.bfs_0_1(o, d)[1] == mapa_brasil.bfs_caminho_mais_curto(o, d)[1]
+        for o in cidades for d in cidades
+    )
+    if iguais:
+        print("✓ PASSOU: Custos unitários coincidem com o BFS comum")
+        sucesso += 1
+    else:
+        print("✗ FALHOU: Custos unitários divergentes do BFS comum")
+
+    try:
+        mapa.adicionar_estrada("A", "F", 2)
+        print("✗ FALHOU: Custo 2 deveria ser rejeitado")
+    except ValueError:
+        if mapa.bfs_0_1("A", "Cidade Falsa") is None:
+            print("✓ PASSOU: Custo inválido e cidade inexistente tratados")
+            sucesso += 1
+
+    # Laço (cidade ligada a ela mesma) entra uma única vez na adjacência e no CSR
+    mapa_laco = GrafoCidades()
+    mapa_laco.adicionar_estrada("A", "A", 0)
+    mapa_laco.adicionar_estrada("A", "B")
+    if mapa_laco.grafo["A"] == ["A", "B"] and mapa_laco.congelar().num_estradas() == 2:
+        print("✓ PASSOU: Laço registrado sem duplicata")
+        sucesso += 1
+    else:
+        print(f"✗ FALHOU: Adjacência com laço {mapa_laco.grafo['A']}")
+
+    print(f"\nResultado: {sucesso}/{total} testes passaram")
+    return sucesso == total
+
+
 def executar_todos_testes():
     # Executa todos os testes e mostra resumo final
     print("\n" + "="*70)
@@ -240,6 +711,16 @@ def executar_todos_testes():
         ("Grafo Desconexo", teste_grafo_desconexo),
         ("Tamanho do Grafo", teste_tamanho_grafo),
         ("Bidirecionalidade", teste_bidirecionalidade),
+        ("BFS Bidirecional", teste_bfs_bidirecional),
+        ("Grafo CSR", teste_grafo_csr),
+        ("BFS em Lote", teste_bfs_lote),
+        ("BFS Otimização de Direção", teste_bfs_direcao_otimizada),
+        ("BFS Matricial", teste_bfs_matricial),
+        ("Tabela de Distâncias", teste_tabela_distancias),
+        ("Gerador de Níveis", teste_bfs_niveis),
+        ("Índice de Vizinhança", teste_indice_vizinhanca),
+        ("Caminhos Mínimos", teste_caminhos_minimos),
+        ("BFS 0-1", teste_bfs_0_1),
     ]
 
     resultados = []
@@ -81,6 +81,38 @@ def desenhar_mapa(destacar_caminho=None):
     return plt
 
 
+def animar_niveis(origem="São Paulo", intervalo=1.0):
+    # Anima a expansão do BFS nível a nível, consumindo as fronteiras de bfs_niveis sob demanda
+    print(f"Animando BFS a partir de {origem}...")
+
+    mapa_obj = criar_mapa_brasil()
+
+    G = nx.Graph()
+    for cidade, vizinhos in mapa_obj.grafo.items():
+        for vizinho in vizinhos:
+            G.add_edge(cidade, vizinho)
+
+    plt.figure(figsize=(16, 12))
+    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+
+    nx.draw_networkx_edges(G, pos, alpha=0.3, width=2, edge_color='gray')
+    nx.draw_networkx_nodes(G, pos, node_color='lightgray', node_size=600, alpha=0.7)
+    nx.draw_networkx_labels(G, pos, font_size=8, font_weight='bold')
+    plt.axis('off')
+
+    # Uma cor por nível; cada fronteira é desenhada assim que é gerada
+    cores = plt.cm.viridis
+    for nivel, cidades in mapa_obj.bfs_niveis(origem):
+        nx.draw_networkx_nodes(G, pos, nodelist=cidades, node_color=[cores(min(nivel / 6, 1.0))],
+                               node_size=800, alpha=0.9)
+        plt.title(f"BFS a partir de {origem} - Nível {nivel}: {len(cidades)} cidade(s)",
+                  fontsize=16, fontweight='bold')
+        plt.pause(intervalo)
+
+    plt.tight_layout()
+    return plt
+
+
 def exemplo_visualizacao():
     # Demonstra as visualizações possíveis com opção de salvar e exibir
     print("\n" + "="*70)
@@ -91,9 +123,10 @@ def exemplo_visualizacao():
     print("2. Exemplo: São Paulo → Fortaleza")
     print("3. Exemplo: Manaus → Porto Alegre")
     print("4. Exemplo: Rio de Janeiro → Cuiabá")
+    print("5. Animação dos níveis do BFS a partir de São Paulo")
     print("="*70)
 
-    opcao = input("\nEscolha uma opção (1-4): ").strip()
+    opcao = input("\nEscolha uma opção (1-5): ").strip()
 
     if opcao == "1":
         plt = desenhar_mapa()
@@ -119,6 +152,9 @@ def exemplo_visualizacao():
             caminho, _ = resultado
             plt = desenhar_mapa(destacar_caminho=caminho)
             arquivo = "caminho_rio_cuiaba.png"
+    elif opcao == "5":
+        plt = animar_niveis("São Paulo")
+        arquivo = "niveis_bfs_sao_paulo.png"
     else:
         print("Opção inválida!")
         return
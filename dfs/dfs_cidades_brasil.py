@@ -11,12 +11,257 @@ Características:
 - Visualização do grafo
 - Detecção de componentes conectados
 - Identificação de ciclos
+
+Os algoritmos usam apenas a biblioteca padrão; matplotlib e networkx só são
+importados na primeira chamada de visualizar_grafo.
 """
 
-import matplotlib.pyplot as plt
-import networkx as nx
+import random
+from array import array
 from collections import defaultdict, deque
-from typing import List, Dict, Set, Tuple
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
+
+
+class UnionFind:
+    """
+    Estrutura Union-Find (conjuntos disjuntos) sobre nomes de cidades.
+    
+    Usada para manter os componentes conectados atualizados à medida que
+    estradas são adicionadas, sem precisar refazer o DFS completo.
+    Usa união por tamanho e compressão de caminho por divisão (iterativa).
+    
+    Atributos:
+        pai: Mapa de cada cidade para seu pai na floresta
+        tamanho: Número de cidades no conjunto de cada representante
+        num_conjuntos: Quantidade atual de conjuntos disjuntos
+    """
+    
+    def __init__(self):
+        """Inicializa a estrutura vazia."""
+        self.pai: Dict[str, str] = {}
+        self.tamanho: Dict[str, int] = {}
+        self.num_conjuntos = 0
+    
+    def __len__(self) -> int:
+        """Número de cidades registradas."""
+        return len(self.pai)
+    
+    def adicionar(self, cidade: str):
+        """Registra uma cidade como um conjunto unitário (se ainda não existir)."""
+        if cidade not in self.pai:
+            self.pai[cidade] = cidade
+            self.tamanho[cidade] = 1
+            self.num_conjuntos += 1
+    
+    def find(self, cidade: str) -> str:
+        """Retorna o representante do conjunto da cidade (divisão de caminho, sem recursão)."""
+        pai = self.pai
+        while pai[cidade] != cidade:
+            pai[cidade] = pai[pai[cidade]]
+            cidade = pai[cidade]
+        return cidade
+    
+    def union(self, cidade1: str, cidade2: str) -> bool:
+        """
+        Une os conjuntos de duas cidades (união por tamanho).
+        
+        Returns:
+            True se os conjuntos eram diferentes, False se já estavam unidos
+        """
+        raiz1 = self.find(cidade1)
+        raiz2 = self.find(cidade2)
+        if raiz1 == raiz2:
+            return False
+        
+        if self.tamanho[raiz1] < self.tamanho[raiz2]:
+            raiz1, raiz2 = raiz2, raiz1
+        self.pai[raiz2] = raiz1
+        self.tamanho[raiz1] += self.tamanho[raiz2]
+        self.num_conjuntos -= 1
+        return True
+
+
+class DAGCondensacao:
+    """
+    Componentes fortemente conexos (SCCs) e o DAG de condensação do grafo.
+    
+    Cada SCC vira um único vértice; as conexões entre SCCs formam um grafo
+    acíclico (DAG). Consultas de alcançabilidade e caminhos em grafos de mão
+    única podem trabalhar sobre esse DAG, bem menor que o grafo original.
+    
+    Atributos:
+        componentes: Lista de SCCs, cada um com suas cidades
+        componente: Mapa de cada cidade para o índice do seu SCC
+        sucessores: Para cada SCC, os SCCs alcançados por uma conexão direta
+        ordem_topologica: Índices dos SCCs em ordem topológica (origens primeiro)
+    """
+    
+    def __init__(self, grafo: 'GrafoCidadesBrasil'):
+        """Calcula os SCCs (Kosaraju iterativo) e o DAG de condensação em O(V + E)."""
+        self.componentes: List[List[str]] = grafo._componentes_fortes()
+        self.componente: Dict[str, int] = {}
+        for indice, membros in enumerate(self.componentes):
+            for cidade in membros:
+                self.componente[cidade] = indice
+        
+        self.sucessores: List[Set[int]] = [set() for _ in self.componentes]
+        for cidade, vizinhos in grafo.grafo.items():
+            origem = self.componente[cidade]
+            for vizinho in vizinhos:
+                destino = self.componente[vizinho]
+                if destino != origem:
+                    self.sucessores[origem].add(destino)
+        
+        # Kosaraju já entrega os SCCs em ordem topológica do DAG
+        self.ordem_topologica: List[int] = list(range(len(self.componentes)))
+    
+    def __len__(self) -> int:
+        """Número de SCCs."""
+        return len(self.componentes)
+
+
+class IndiceAlcance:
+    """
+    Índice de alcançabilidade compacto para grafos com conexões de mão única.
+    
+    Em vez do fecho transitivo (C²/8 bytes para C componentes), cada SCC do
+    DAG de condensação (DAGCondensacao) recebe alguns rótulos inteiros:
+    - posição topológica: conexões só avançam na ordem, então um destino
+      anterior à origem nunca é alcançável
+    - intervalo de pós-ordem [baixo, fim] por travessia (rótulos GRAIL): se B é
+      alcançável a partir de A, o intervalo de B está contido no de A
+    - intervalo da árvore da 1ª travessia: se B é descendente de A na árvore
+      de busca, B é alcançável
+    Quando os rótulos não decidem, um DFS no DAG podado pelos próprios rótulos
+    dá a resposta exata.
+    
+    Memória: O(C · travessias) inteiros em array('i').
+    Construção: O(travessias · (C + E)) sobre o DAG.
+    
+    Atributos:
+        dag: DAG de condensação usado na construção
+        posicao: Posição de cada SCC na ordem topológica
+        entrada: Primeiro posto da subárvore de cada SCC (1ª travessia)
+        fins: Posto de pós-ordem de cada SCC, um array por travessia
+        baixos: Menor posto alcançável a partir de cada SCC, um array por travessia
+    """
+    
+    def __init__(self, dag: DAGCondensacao, travessias: int = 2, semente: int = 0):
+        """
+        Rotula o DAG de condensação.
+        
+        Args:
+            dag: DAG de condensação do grafo
+            travessias: Número de travessias com ordens de visita diferentes
+                        (mais travessias = mais consultas decididas sem DFS)
+            semente: Semente das ordens aleatórias das travessias extras
+        """
+        self.dag = dag
+        self.posicao = array('i', [0]) * len(dag)
+        for posicao, indice in enumerate(dag.ordem_topologica):
+            self.posicao[indice] = posicao
+        
+        gerador = random.Random(semente)
+        self.fins: List[array] = []
+        self.baixos: List[array] = []
+        for numero in range(max(1, travessias)):
+            entrada, fim, baixo = self._rotular(gerador if numero else None)
+            if numero == 0:
+                self.entrada = entrada
+            self.fins.append(fim)
+            self.baixos.append(baixo)
+    
+    def _rotular(self, gerador: Optional[random.Random]) -> Tuple[array, array, array]:
+        """Uma travessia em pós-ordem do DAG (iterativa); gerador embaralha a ordem de visita."""
+        sucessores = self.dag.sucessores
+        total = len(self.dag)
+        entrada = array('i', [-1]) * total
+        fim = array('i', [0]) * total
+        baixo = array('i', [0]) * total
+        
+        def filhos(indice: int) -> List[int]:
+            lista = list(sucessores[indice])
+            if gerador is not None:
+                gerador.shuffle(lista)
+            return lista
+        
+        raizes = list(self.dag.ordem_topologica)
+        if gerador is not None:
+            gerador.shuffle(raizes)
+        
+        contador = 0
+        for raiz in raizes:
+            if entrada[raiz] != -1:
+                continue
+            entrada[raiz] = contador
+            pilha = [(raiz, iter(filhos(raiz)))]
+            while pilha:
+                indice, vizinhos = pilha[-1]
+                for filho in vizinhos:
+                    if entrada[filho] == -1:
+                        entrada[filho] = contador
+                        pilha.append((filho, iter(filhos(filho))))
+                        break
+                else:
+                    # Todos os sucessores já terminaram (o DAG não tem ciclos)
+                    pilha.pop()
+                    fim[indice] = contador
+                    contador += 1
+                    menor = fim[indice]
+                    for filho in sucessores[indice]:
+                        if baixo[filho] < menor:
+                            menor = baixo[filho]
+                    baixo[indice] = menor
+        
+        return entrada, fim, baixo
+    
+    def _pode_alcancar(self, origem: int, destino: int) -> bool:
+        """Filtro negativo: False garante que não há caminho entre os SCCs."""
+        if self.posicao[origem] > self.posicao[destino]:
+            return False
+        for fim, baixo in zip(self.fins, self.baixos):
+            if not (baixo[origem] <= baixo[destino] and fim[destino] <= fim[origem]):
+                return False
+        return True
+    
+    def alcanca(self, origem: str, destino: str) -> bool:
+        """
+        Verifica se existe caminho de origem até destino.
+        
+        A maioria das consultas é decidida pelos rótulos em O(travessias);
+        as demais caem num DFS no DAG que só visita SCCs ainda candidatos.
+        
+        Returns:
+            True se destino é alcançável a partir de origem
+        """
+        componente = self.dag.componente
+        if origem not in componente or destino not in componente:
+            return False
+        scc_origem = componente[origem]
+        scc_destino = componente[destino]
+        if scc_origem == scc_destino:
+            return True
+        if not self._pode_alcancar(scc_origem, scc_destino):
+            return False
+        # Descendente na árvore da 1ª travessia: caminho garantido
+        if self.entrada[scc_origem] <= self.fins[0][scc_destino] <= self.fins[0][scc_origem]:
+            return True
+        
+        visitados = {scc_origem}
+        pilha = [scc_origem]
+        while pilha:
+            for sucessor in self.dag.sucessores[pilha.pop()]:
+                if sucessor == scc_destino:
+                    return True
+                if sucessor not in visitados and self._pode_alcancar(sucessor, scc_destino):
+                    visitados.add(sucessor)
+                    pilha.append(sucessor)
+        return False
+    
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados pelos rótulos (sem contar o DAG)."""
+        rotulos = [self.posicao, self.entrada] + self.fins + self.baixos
+        return sum(r.itemsize * len(r) for r in rotulos)
 
 
 class GrafoCidadesBrasil:
@@ -24,15 +269,32 @@ class GrafoCidadesBrasil:
     Classe que representa um grafo de cidades brasileiras usando lista de adjacências.
     
     Atributos:
-        grafo: Dicionário onde a chave é a cidade e o valor é uma lista de cidades conectadas
+        grafo: Dicionário onde a chave é a cidade e o valor é o conjunto ordenado das
+               cidades conectadas (um dict com valores None: mantém a ordem de inserção,
+               ignora conexões repetidas e testa pertinência em O(1))
         num_vertices: Número total de cidades no grafo
     """
     
     def __init__(self):
-        """Inicializa o grafo como um dicionário de listas de adjacências."""
-        self.grafo = defaultdict(list)
+        """Inicializa o grafo como um dicionário de adjacências sem repetição."""
+        self.grafo: Dict[str, Dict[str, None]] = defaultdict(dict)
         self.num_vertices = 0
         self.cidades = set()
+        # Componentes conectados mantidos incrementalmente a cada nova estrada
+        self.componentes = UnionFind()
+        # True quando alguma conexão de mão única foi adicionada
+        self.direcionado = False
+        # SCCs e índice de alcançabilidade (construídos sob demanda, descartados a cada alteração)
+        self._dag: Optional[DAGCondensacao] = None
+        self._indice_alcance: Optional[IndiceAlcance] = None
+        # Agregados mantidos a cada alteração para estatisticas() em O(1)
+        self.num_entradas = 0                        # soma dos tamanhos das listas de adjacência
+        self.num_lacos = 0                           # conexões de uma cidade com ela mesma
+        self.histograma_graus: Dict[int, int] = {}   # grau (>= 1) -> número de cidades
+        self.grau_maximo = 0
+        self.cidade_grau_maximo: Optional[str] = None
+        # Estatísticas caras (diâmetro, componentes), calculadas sob demanda
+        self._estatisticas_caras: Optional[Dict[str, int]] = None
     
     def adicionar_aresta(self, cidade1: str, cidade2: str, bidirecional: bool = True):
         """
@@ -42,24 +304,270 @@ class GrafoCidadesBrasil:
             cidade1: Cidade de origem
             cidade2: Cidade de destino
             bidirecional: Se True, cria conexão nos dois sentidos (grafo não-direcionado)
+        
+        Conexões já existentes são ignoradas, então listas de estradas com
+        repetições não inflam as buscas.
         """
-        self.grafo[cidade1].append(cidade2)
+        nova_ida = cidade2 not in self.grafo[cidade1]
+        nova_volta = bidirecional and cidade1 != cidade2 and cidade1 not in self.grafo[cidade2]
         self.cidades.add(cidade1)
         self.cidades.add(cidade2)
         
-        if bidirecional:
-            self.grafo[cidade2].append(cidade1)
-        
+        if not bidirecional:
+            self.direcionado = True
         self.num_vertices = len(self.cidades)
+        
+        if not (nova_ida or nova_volta):
+            return
+        
+        self._invalidar_caches()
+        
+        # Insere e atualiza os agregados das estatísticas
+        if nova_ida:
+            self.grafo[cidade1][cidade2] = None
+            self._ajustar_grau(cidade1, +1)
+            if cidade1 == cidade2:
+                self.num_lacos += 1
+        if nova_volta:
+            self.grafo[cidade2][cidade1] = None
+            self._ajustar_grau(cidade2, +1)
+        
+        # Atualiza os componentes em tempo quase constante (sem DFS)
+        self.componentes.adicionar(cidade1)
+        self.componentes.adicionar(cidade2)
+        self.componentes.union(cidade1, cidade2)
+    
+    def remover_aresta(self, cidade1: str, cidade2: str, bidirecional: bool = True):
+        """
+        Remove uma conexão (aresta) entre duas cidades.
+        
+        O Union-Find não desfaz uniões, então os componentes são recalculados
+        do zero após a remoção.
+        
+        Args:
+            cidade1: Cidade de origem
+            cidade2: Cidade de destino
+            bidirecional: Se True, remove a conexão nos dois sentidos
+        """
+        if cidade2 in self.grafo.get(cidade1, ()):
+            del self.grafo[cidade1][cidade2]
+            self._ajustar_grau(cidade1, -1)
+            if cidade1 == cidade2:
+                self.num_lacos -= 1
+        if bidirecional and cidade1 in self.grafo.get(cidade2, ()):
+            del self.grafo[cidade2][cidade1]
+            self._ajustar_grau(cidade2, -1)
+        
+        self._invalidar_caches()
+        self._recalcular_componentes()
+    
+    def tem_aresta(self, cidade1: str, cidade2: str) -> bool:
+        """
+        Verifica em O(1) se existe conexão de cidade1 para cidade2.
+        
+        Args:
+            cidade1: Cidade de origem
+            cidade2: Cidade de destino
+            
+        Returns:
+            True se a conexão existe
+        """
+        return cidade2 in self.grafo.get(cidade1, ())
+    
+    def _invalidar_caches(self):
+        """Descarta as estruturas derivadas do grafo (SCCs, alcance, estatísticas caras)."""
+        self._dag = None
+        self._indice_alcance = None
+        self._estatisticas_caras = None
+    
+    def _ajustar_grau(self, cidade: str, delta: int):
+        """
+        Atualiza os agregados depois que a lista de adjacência de 'cidade'
+        ganhou (delta = +1) ou perdeu (delta = -1) uma entrada.
+        """
+        grau = len(self.grafo[cidade])
+        anterior = grau - delta
+        self.num_entradas += delta
+        
+        if anterior > 0:
+            self.histograma_graus[anterior] -= 1
+            if self.histograma_graus[anterior] == 0:
+                del self.histograma_graus[anterior]
+        if grau > 0:
+            self.histograma_graus[grau] = self.histograma_graus.get(grau, 0) + 1
+        
+        if grau > self.grau_maximo:
+            self.grau_maximo = grau
+            self.cidade_grau_maximo = cidade
+        elif delta < 0 and cidade == self.cidade_grau_maximo:
+            # Remoção é rara: reencontra o maior grau com uma varredura O(V)
+            self.cidade_grau_maximo = max(self.grafo, key=lambda c: len(self.grafo[c]), default=None)
+            self.grau_maximo = len(self.grafo[self.cidade_grau_maximo]) if self.cidade_grau_maximo else 0
+    
+    def _recalcular_componentes(self):
+        """
+        Reconstrói do zero o Union-Find dos componentes (O(V + E)).
+        
+        Percorre todas as conexões em vez de um DFS para tratar conexões de mão
+        única do mesmo jeito que adicionar_aresta (componentes fracamente conexos).
+        """
+        self.componentes = UnionFind()
+        for cidade in self.cidades:
+            self.componentes.adicionar(cidade)
+        for cidade, vizinhos in self.grafo.items():
+            for vizinho in vizinhos:
+                self.componentes.union(cidade, vizinho)
+    
+    def _sincronizar_componentes(self):
+        """Registra cidades inseridas diretamente em self.cidades (sem adicionar_aresta)."""
+        if len(self.componentes) != len(self.cidades):
+            for cidade in self.cidades:
+                self.componentes.adicionar(cidade)
+    
+    def numero_componentes(self) -> int:
+        """
+        Número de componentes conectados, mantido incrementalmente.
+        
+        Conexões de mão única contam como ligação (componentes fracamente conexos).
+        
+        Returns:
+            Quantidade de componentes, em tempo quase O(1)
+        """
+        self._sincronizar_componentes()
+        return self.componentes.num_conjuntos
+    
+    def mesmo_componente(self, cidade1: str, cidade2: str) -> bool:
+        """
+        Verifica se duas cidades estão no mesmo componente conectado.
+        
+        Returns:
+            True se estão conectadas (ignorando o sentido das conexões)
+        """
+        if cidade1 not in self.cidades or cidade2 not in self.cidades:
+            return False
+        self._sincronizar_componentes()
+        return self.componentes.find(cidade1) == self.componentes.find(cidade2)
+    
+    def componente_de(self, cidade: str) -> Optional[str]:
+        """
+        Identifica o componente de uma cidade.
+        
+        Returns:
+            Cidade representante do componente, ou None se a cidade não existe
+        """
+        if cidade not in self.cidades:
+            return None
+        self._sincronizar_componentes()
+        return self.componentes.find(cidade)
+    
+    def alcanca(self, origem: str, destino: str) -> bool:
+        """
+        Responde se existe caminho de origem até destino, sem montar o caminho.
+        
+        - Grafo não-direcionado: compara os rótulos de componente (Union-Find)
+        - Grafo com mão única: consulta o IndiceAlcance se ele já foi construído
+          com indice_alcance(); senão, roda um DFS a partir da origem (O(V + E))
+        
+        Returns:
+            True se destino é alcançável a partir de origem
+        """
+        if origem == destino:
+            return origem in self.cidades
+        if not self.direcionado:
+            return self.mesmo_componente(origem, destino)
+        if self._indice_alcance is not None:
+            return self._indice_alcance.alcanca(origem, destino)
+        if origem not in self.cidades:
+            return False
+        
+        def ao_entrar(cidade: str, pai: Optional[str]) -> bool:
+            return cidade == destino
+        
+        return self._percorrer_dfs(origem, set(), ao_entrar=ao_entrar)
+    
+    def indice_alcance(self) -> IndiceAlcance:
+        """
+        Constrói (opt-in) e retorna o índice de alcançabilidade do grafo atual.
+        
+        Vale a pena com muitas consultas de alcançabilidade no mesmo grafo de
+        mão única; a partir daí alcanca() passa a usá-lo até a próxima alteração.
+        """
+        if self._indice_alcance is None:
+            self._indice_alcance = IndiceAlcance(self.componentes_fortemente_conexos())
+        return self._indice_alcance
+    
+    def componentes_fortemente_conexos(self) -> DAGCondensacao:
+        """
+        Componentes fortemente conexos e DAG de condensação do grafo atual.
+        
+        Considera o sentido das conexões (ao contrário de dfs_completo, que
+        segue o grafo como não-direcionado). O resultado fica em cache até a
+        próxima alteração e é reaproveitado pelas consultas de alcançabilidade.
+        
+        Complexidade de Tempo: O(V + E)
+        
+        Returns:
+            DAGCondensacao com os SCCs, as conexões entre eles e a ordem topológica
+        """
+        if self._dag is None:
+            self._dag = DAGCondensacao(self)
+        return self._dag
+    
+    def _componentes_fortes(self) -> List[List[str]]:
+        """
+        Componentes fortemente conexos pelo algoritmo de Kosaraju (O(V + E)).
+        
+        1ª passada: DFS no grafo registrando a ordem de término (pós-ordem)
+        2ª passada: DFS no grafo reverso, em ordem decrescente de término
+        Ambas usam o motor iterativo, então não há limite de recursão.
+        
+        Returns:
+            Lista de componentes em ordem topológica do DAG de condensação
+        """
+        ordem_termino: List[str] = []
+        
+        def ao_sair(cidade: str) -> bool:
+            ordem_termino.append(cidade)
+            return False
+        
+        visitados: Set[str] = set()
+        for cidade in self.cidades:
+            if cidade not in visitados:
+                self._percorrer_dfs(cidade, visitados, ao_sair=ao_sair)
+        
+        reverso = self._grafo_reverso()
+        componentes: List[List[str]] = []
+        
+        def ao_entrar(cidade: str, pai: Optional[str]) -> bool:
+            componentes[-1].append(cidade)
+            return False
+        
+        visitados = set()
+        for cidade in reversed(ordem_termino):
+            if cidade not in visitados:
+                componentes.append([])
+                self._percorrer_dfs(cidade, visitados, ao_entrar=ao_entrar, adjacencias=reverso)
+        
+        return componentes
+    
+    def _grafo_reverso(self) -> Dict[str, List[str]]:
+        """Listas de adjacência com o sentido de todas as conexões invertido (O(V + E))."""
+        reverso: Dict[str, List[str]] = defaultdict(list)
+        for cidade, vizinhos in self.grafo.items():
+            for vizinho in vizinhos:
+                reverso[vizinho].append(cidade)
+        return reverso
     
     def dfs_recursivo(self, cidade_inicial: str, visitados: Set[str] = None, caminho: List[str] = None) -> List[str]:
         """
-        Implementação RECURSIVA do algoritmo DFS.
+        Implementação do DFS com a ordem de visitação da versão RECURSIVA.
         
         O DFS explora o grafo indo o mais fundo possível em cada ramo antes de retroceder.
+        A recursão é simulada pelo motor _percorrer_dfs (pilha explícita de iteradores),
+        então cadeias longas de cidades não estouram o limite de recursão do Python.
         
         Complexidade de Tempo: O(V + E) onde V = vértices e E = arestas
-        Complexidade de Espaço: O(V) para a pilha de recursão e conjunto de visitados
+        Complexidade de Espaço: O(V) para a pilha explícita e conjunto de visitados
         
         Args:
             cidade_inicial: Cidade de onde a busca começa
@@ -75,18 +583,74 @@ class GrafoCidadesBrasil:
         if caminho is None:
             caminho = []
         
-        # Marca a cidade atual como visitada
+        def ao_entrar(cidade: str, pai: Optional[str]) -> bool:
+            # Marca a cidade atual como visitada (pré-ordem)
+            caminho.append(cidade)
+            print(f"Visitando: {cidade}")
+            return False
+        
+        self._percorrer_dfs(cidade_inicial, visitados, ao_entrar=ao_entrar)
+        return caminho
+    
+    def _percorrer_dfs(self, cidade_inicial: str, visitados: Set[str],
+                       ao_entrar: Optional[Callable[[str, Optional[str]], bool]] = None,
+                       ao_sair: Optional[Callable[[str], bool]] = None,
+                       aresta_retorno: Optional[Callable[[str, str, Optional[str]], bool]] = None,
+                       adjacencias: Optional[Dict[str, Iterable[str]]] = None) -> bool:
+        """
+        Motor de DFS sem recursão usado por todas as travessias em profundidade da classe.
+        
+        Mantém uma pilha explícita de (cidade, pai, iterador de vizinhos). Cada iterador
+        guarda em que vizinho a cidade parou, exatamente como o quadro de uma chamada
+        recursiva, então a ordem de visitação é a mesma da versão recursiva e a pilha
+        nunca passa de O(V) entradas (uma por cidade no ramo atual).
+        
+        Args:
+            cidade_inicial: Cidade de onde a busca começa
+            visitados: Conjunto de cidades já visitadas (atualizado pelo motor)
+            ao_entrar: Chamada em pré-ordem com (cidade, pai)
+            ao_sair: Chamada em pós-ordem com (cidade), após explorar todos os vizinhos
+            aresta_retorno: Chamada com (cidade, vizinho, pai da cidade) quando o vizinho
+                já visitado ainda está na pilha (aresta de retorno)
+            adjacencias: Listas de adjacência a percorrer (padrão: self.grafo)
+            
+        Qualquer callback que retorne True interrompe a busca imediatamente.
+        
+        Returns:
+            True se a busca foi interrompida por um callback, False se terminou
+        """
+        if adjacencias is None:
+            adjacencias = self.grafo
+        
         visitados.add(cidade_inicial)
-        caminho.append(cidade_inicial)
+        if ao_entrar and ao_entrar(cidade_inicial, None):
+            return True
         
-        print(f"Visitando: {cidade_inicial}")
+        pilha = [(cidade_inicial, None, iter(adjacencias.get(cidade_inicial, ())))]
+        na_pilha = {cidade_inicial}
         
-        # Explora recursivamente todas as cidades adjacentes não visitadas
-        for cidade_vizinha in self.grafo[cidade_inicial]:
-            if cidade_vizinha not in visitados:
-                self.dfs_recursivo(cidade_vizinha, visitados, caminho)
+        while pilha:
+            cidade, pai, vizinhos = pilha[-1]
+            
+            for vizinho in vizinhos:
+                if vizinho not in visitados:
+                    # Desce um nível: equivale a uma chamada recursiva
+                    visitados.add(vizinho)
+                    if ao_entrar and ao_entrar(vizinho, cidade):
+                        return True
+                    pilha.append((vizinho, cidade, iter(adjacencias.get(vizinho, ()))))
+                    na_pilha.add(vizinho)
+                    break
+                if aresta_retorno and vizinho in na_pilha and aresta_retorno(cidade, vizinho, pai):
+                    return True
+            else:
+                # Todos os vizinhos explorados: retrocede (retorno da chamada recursiva)
+                pilha.pop()
+                na_pilha.discard(cidade)
+                if ao_sair and ao_sair(cidade):
+                    return True
         
-        return caminho
+        return False
     
     def dfs_iterativo(self, cidade_inicial: str) -> List[str]:
         """
@@ -153,14 +717,13 @@ class GrafoCidadesBrasil:
         return componentes
     
     def _dfs_auxiliar(self, cidade: str, visitados: Set[str], caminho: List[str]):
-        """Função auxiliar recursiva para DFS completo."""
-        visitados.add(cidade)
-        caminho.append(cidade)
-        print(f"  - {cidade}")
+        """Função auxiliar para DFS completo (usa o motor iterativo)."""
+        def ao_entrar(atual: str, pai: Optional[str]) -> bool:
+            caminho.append(atual)
+            print(f"  - {atual}")
+            return False
         
-        for vizinho in self.grafo[cidade]:
-            if vizinho not in visitados:
-                self._dfs_auxiliar(vizinho, visitados, caminho)
+        self._percorrer_dfs(cidade, visitados, ao_entrar=ao_entrar)
     
     def encontrar_caminho_dfs(self, origem: str, destino: str) -> List[str]:
         """
@@ -173,6 +736,12 @@ class GrafoCidadesBrasil:
         Returns:
             Lista representando o caminho encontrado, ou lista vazia se não existe
         """
+        # Consulta barata (Union-Find ou índice já construído): só roda o DFS com
+        # backtracking se o caminho existe. Sem índice, em mão única, o próprio DFS responde
+        if origem != destino and (not self.direcionado or self._indice_alcance is not None):
+            if not self.alcanca(origem, destino):
+                return []
+        
         visitados = set()
         caminho = []
         
@@ -180,55 +749,313 @@ class GrafoCidadesBrasil:
             return caminho
         return []
     
-    def _dfs_caminho_auxiliar(self, atual: str, destino: str, visitados: Set[str], caminho: List[str]) -> bool:
-        """Função auxiliar recursiva para encontrar caminho."""
-        visitados.add(atual)
-        caminho.append(atual)
+    def caminhos_simples(self, origem: str, destino: str,
+                         max_conexoes: Optional[int] = None,
+                         max_caminhos: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Gera, sob demanda, os caminhos simples (sem repetir cidade) de origem até destino.
         
-        # Se chegou ao destino, retorna True
-        if atual == destino:
-            return True
+        DFS iterativo com backtracking: a pilha guarda apenas o caminho atual e
+        um iterador de vizinhos por nível, então a memória é O(profundidade)
+        e cada caminho só é montado no momento em que é gerado.
         
-        # Explora vizinhos
-        for vizinho in self.grafo[atual]:
-            if vizinho not in visitados:
-                if self._dfs_caminho_auxiliar(vizinho, destino, visitados, caminho):
-                    return True
+        Poda dos ramos que não podem chegar ao destino (só em grafos de mão
+        única ou com max_conexoes):
+        - mão única sem limite de tamanho: as cidades que chegam ao destino
+          (um BFS no grafo reverso)
+        - com max_conexoes: distâncias até o destino (o mesmo BFS), descartando
+          o ramo se o caminho atual + a distância restante passar do limite
+        Em grafos não-direcionados sem max_conexoes não há poda por ramo: todo
+        vizinho está no mesmo componente do destino. Só a consulta inicial ao
+        Union-Find descarta origem e destino em componentes diferentes.
         
-        # Se não encontrou o caminho, remove da lista (backtracking)
-        caminho.pop()
-        return False
+        Args:
+            origem: Cidade de partida
+            destino: Cidade de chegada
+            max_conexoes: Número máximo de conexões (arestas) por caminho
+            max_caminhos: Número máximo de caminhos gerados
+            
+        Yields:
+            Cada caminho como uma nova lista de cidades, de origem até destino
+        """
+        if max_caminhos is not None and max_caminhos <= 0:
+            return
+        if origem == destino:
+            if origem in self.cidades:
+                yield [origem]
+            return
+        
+        if max_conexoes is None and not self.direcionado:
+            if not self.mesmo_componente(origem, destino):
+                return
+            
+            def promissor(cidade: str, conexoes: int) -> bool:
+                return True
+        else:
+            # Um BFS no grafo reverso, em vez de um índice de alcançabilidade completo
+            distancia_restante = self._distancias_ate(destino)
+            limite = len(self.cidades) if max_conexoes is None else max_conexoes
+            
+            def promissor(cidade: str, conexoes: int) -> bool:
+                distancia = distancia_restante.get(cidade)
+                return distancia is not None and conexoes + distancia <= limite
+            
+            if not promissor(origem, 0):
+                return
+        
+        caminho = [origem]
+        no_caminho = {origem}
+        pilha = [iter(self.grafo.get(origem, ()))]
+        encontrados = 0
+        
+        while pilha:
+            for vizinho in pilha[-1]:
+                # len(caminho) = conexões usadas depois de ir até o vizinho
+                if vizinho in no_caminho or not promissor(vizinho, len(caminho)):
+                    continue
+                if vizinho == destino:
+                    yield caminho + [destino]
+                    encontrados += 1
+                    if max_caminhos is not None and encontrados >= max_caminhos:
+                        return
+                    continue
+                # Desce um nível
+                caminho.append(vizinho)
+                no_caminho.add(vizinho)
+                pilha.append(iter(self.grafo.get(vizinho, ())))
+                break
+            else:
+                # Vizinhos esgotados: backtracking
+                pilha.pop()
+                no_caminho.discard(caminho.pop())
+    
+    def _distancias_ate(self, destino: str) -> Dict[str, int]:
+        """Menor número de conexões de cada cidade até destino (BFS no grafo reverso)."""
+        adjacencias = self._grafo_reverso() if self.direcionado else self.grafo
+        distancias = {destino: 0}
+        fila = deque([destino])
+        while fila:
+            atual = fila.popleft()
+            for vizinho in adjacencias.get(atual, ()):
+                if vizinho not in distancias:
+                    distancias[vizinho] = distancias[atual] + 1
+                    fila.append(vizinho)
+        return distancias
+    
+    def _dfs_caminho_auxiliar(self, atual: str, destino: str, visitados: Set[str], caminho: List[str]) -> bool:
+        """Função auxiliar para encontrar caminho (usa o motor iterativo)."""
+        def ao_entrar(cidade: str, pai: Optional[str]) -> bool:
+            caminho.append(cidade)
+            # Se chegou ao destino, interrompe a busca
+            return cidade == destino
+        
+        def ao_sair(cidade: str) -> bool:
+            # Se não encontrou o caminho por aqui, remove da lista (backtracking)
+            caminho.pop()
+            return False
+        
+        return self._percorrer_dfs(atual, visitados, ao_entrar=ao_entrar, ao_sair=ao_sair)
     
     def detectar_ciclo(self) -> bool:
         """
         Detecta se existe algum ciclo no grafo usando DFS.
         
+        Com conexões de mão única o sentido importa: existe ciclo se algum SCC
+        tem mais de uma cidade ou se alguma cidade se conecta a si mesma.
+        
         Returns:
             True se existe ciclo, False caso contrário
         """
+        if self.direcionado:
+            dag = self.componentes_fortemente_conexos()
+            return (any(len(membros) > 1 for membros in dag.componentes) or
+                    any(cidade in vizinhos for cidade, vizinhos in self.grafo.items()))
+        
         visitados = set()
-        pilha_recursao = set()
         
         for cidade in self.cidades:
             if cidade not in visitados:
-                if self._detectar_ciclo_auxiliar(cidade, visitados, pilha_recursao, None):
+                if self._detectar_ciclo_auxiliar(cidade, visitados):
                     return True
         return False
     
-    def _detectar_ciclo_auxiliar(self, cidade: str, visitados: Set[str], pilha_recursao: Set[str], pai: str) -> bool:
-        """Função auxiliar para detectar ciclos."""
-        visitados.add(cidade)
-        pilha_recursao.add(cidade)
+    def _detectar_ciclo_auxiliar(self, cidade: str, visitados: Set[str]) -> bool:
+        """Função auxiliar para detectar ciclos (usa o motor iterativo)."""
+        def aresta_retorno(atual: str, vizinho: str, pai_atual: Optional[str]) -> bool:
+            # Vizinho ainda na pilha e diferente do pai: fecha um ciclo
+            return vizinho != pai_atual
         
-        for vizinho in self.grafo[cidade]:
-            if vizinho not in visitados:
-                if self._detectar_ciclo_auxiliar(vizinho, visitados, pilha_recursao, cidade):
-                    return True
-            elif vizinho in pilha_recursao and vizinho != pai:
-                return True
+        return self._percorrer_dfs(cidade, visitados, aresta_retorno=aresta_retorno)
+    
+    def analisar_pontos_criticos(self) -> Tuple[List[Tuple[str, str]], Set[str], List[List[Tuple[str, str]]]]:
+        """
+        Encontra estradas e cidades críticas com o algoritmo de low-link de Tarjan.
         
-        pilha_recursao.remove(cidade)
-        return False
+        - Ponte: estrada cuja remoção desconecta o grafo
+        - Ponto de articulação: cidade cuja remoção desconecta o grafo
+        - Componente biconexo: grupo máximo de estradas que continua conectado
+          após a remoção de qualquer cidade isolada
+        
+        Tudo é calculado em UMA passada de DFS sobre o motor iterativo (_percorrer_dfs),
+        então funciona em escala nacional sem estourar o limite de recursão.
+        O grafo é tratado como não-direcionado e sem estradas repetidas.
+        
+        Complexidade de Tempo: O(V + E)
+        Complexidade de Espaço: O(V + E) para a pilha de estradas dos componentes
+        
+        Returns:
+            Tupla (pontes, pontos_de_articulacao, componentes_biconexos), onde cada
+            componente biconexo é a lista de suas estradas (cidade1, cidade2)
+        """
+        descoberta: Dict[str, int] = {}   # ordem em que cada cidade foi descoberta
+        low: Dict[str, int] = {}          # menor descoberta alcançável pela subárvore
+        pais: Dict[str, Optional[str]] = {}
+        filhos_raiz = 0
+        raiz: Optional[str] = None
+        
+        pontes: List[Tuple[str, str]] = []
+        articulacoes: Set[str] = set()
+        componentes: List[List[Tuple[str, str]]] = []
+        pilha_estradas: List[Tuple[str, str]] = []
+        
+        def ao_entrar(cidade: str, pai: Optional[str]) -> bool:
+            nonlocal filhos_raiz
+            descoberta[cidade] = low[cidade] = len(descoberta)
+            pais[cidade] = pai
+            if pai is not None:
+                pilha_estradas.append((pai, cidade))
+                if pai == raiz:
+                    filhos_raiz += 1
+            return False
+        
+        def aresta_retorno(cidade: str, ancestral: str, pai: Optional[str]) -> bool:
+            # Estrada para um ancestral (que não seja o próprio pai) fecha um ciclo
+            if ancestral != pai:
+                low[cidade] = min(low[cidade], descoberta[ancestral])
+                pilha_estradas.append((cidade, ancestral))
+            return False
+        
+        def ao_sair(cidade: str) -> bool:
+            pai = pais[cidade]
+            if pai is None:
+                return False
+            low[pai] = min(low[pai], low[cidade])
+            
+            # Nenhuma estrada da subárvore volta acima de 'pai': (pai, cidade) é ponte
+            if low[cidade] > descoberta[pai]:
+                pontes.append((pai, cidade))
+            
+            # A subárvore não alcança nada acima de 'pai': fecha um componente biconexo
+            if low[cidade] >= descoberta[pai]:
+                if pai != raiz:
+                    articulacoes.add(pai)
+                componente = []
+                while True:
+                    estrada = pilha_estradas.pop()
+                    componente.append(estrada)
+                    if estrada == (pai, cidade):
+                        break
+                componentes.append(componente)
+            return False
+        
+        visitados: Set[str] = set()
+        for cidade in self.cidades:
+            if cidade not in visitados:
+                raiz = cidade
+                filhos_raiz = 0
+                self._percorrer_dfs(cidade, visitados, ao_entrar=ao_entrar,
+                                    ao_sair=ao_sair, aresta_retorno=aresta_retorno)
+                # A raiz só é articulação se tiver mais de um filho na árvore DFS
+                if filhos_raiz > 1:
+                    articulacoes.add(cidade)
+        
+        return pontes, articulacoes, componentes
+    
+    def caminho_euleriano(self, inicio: Optional[str] = None) -> List[str]:
+        """
+        Rota que percorre cada conexão exatamente uma vez (algoritmo de Hierholzer).
+        
+        As condições de grau são verificadas antes da busca:
+        - Não-direcionado: 0 cidades de grau ímpar (circuito) ou 2 (caminho entre elas)
+        - Com mão única: saída = entrada em todas as cidades (circuito), ou uma
+          cidade com uma saída a mais (início) e outra com uma entrada a mais (fim)
+        - Todas as conexões no mesmo componente (Union-Find)
+        
+        A travessia é iterativa e guarda um iterador por cidade sobre self.grafo,
+        sem copiar as adjacências: cada entrada é examinada uma vez, O(V + E).
+        
+        Args:
+            inicio: Cidade de partida (padrão: a cidade obrigatória, ou qualquer uma num circuito)
+            
+        Returns:
+            Lista de cidades da rota (começa e termina na mesma cidade se for circuito),
+            ou lista vazia se não há conexões
+            
+        Raises:
+            ValueError: Se não existe rota euleriana, indicando as cidades que violam as condições
+        """
+        if self.direcionado:
+            entrada: Dict[str, int] = defaultdict(int)
+            for vizinhos in self.grafo.values():
+                for vizinho in vizinhos:
+                    entrada[vizinho] += 1
+            saldo = {cidade: len(self.grafo.get(cidade, ())) - entrada[cidade] for cidade in self.cidades}
+            desbalanceadas = sorted(cidade for cidade, valor in saldo.items() if valor != 0)
+            inicios = [cidade for cidade in desbalanceadas if saldo[cidade] == 1]
+            fins = [cidade for cidade in desbalanceadas if saldo[cidade] == -1]
+            if desbalanceadas and not (len(desbalanceadas) == 2 and inicios and fins):
+                detalhes = ", ".join(f"{cidade} ({saldo[cidade]:+d})" for cidade in desbalanceadas)
+                raise ValueError(f"Sem rota euleriana: saldo saída - entrada inválido em {detalhes}")
+        else:
+            # Um laço (cidade ligada a ela mesma) aparece uma vez na adjacência mas soma 2 ao grau
+            inicios = sorted(cidade for cidade in self.cidades
+                             if (len(self.grafo.get(cidade, ())) + self.tem_aresta(cidade, cidade)) % 2)
+            if len(inicios) not in (0, 2):
+                raise ValueError(f"Sem rota euleriana: {len(inicios)} cidades com grau ímpar: {', '.join(inicios)}")
+        
+        com_conexoes = sorted(cidade for cidade in self.cidades if self.grafo.get(cidade))
+        if not com_conexoes:
+            return []
+        
+        regioes: Dict[str, str] = {}
+        for cidade in com_conexoes:
+            regioes.setdefault(self.componente_de(cidade), cidade)
+        if len(regioes) > 1:
+            raise ValueError(f"Sem rota euleriana: conexões em {len(regioes)} componentes desconexos "
+                             f"(ex.: {', '.join(regioes.values())})")
+        
+        if inicio is None:
+            inicio = inicios[0] if inicios else com_conexoes[0]
+        elif inicios and inicio not in inicios:
+            raise ValueError(f"Sem rota euleriana a partir de {inicio}: a rota deve começar em {' ou '.join(inicios)}")
+        elif not inicios and inicio not in com_conexoes:
+            raise ValueError(f"Sem rota euleriana a partir de {inicio}: a cidade não tem conexões")
+        
+        iteradores: Dict[str, Iterator[str]] = {}
+        usadas: Set[Tuple[str, str]] = set()  # arestas já percorridas (só no caso não-direcionado)
+        pilha = [inicio]
+        rota: List[str] = []
+        
+        while pilha:
+            atual = pilha[-1]
+            if atual not in iteradores:
+                iteradores[atual] = iter(self.grafo.get(atual, ()))
+            
+            for vizinho in iteradores[atual]:
+                if not self.direcionado:
+                    aresta = (atual, vizinho) if atual <= vizinho else (vizinho, atual)
+                    if aresta in usadas:
+                        continue
+                    usadas.add(aresta)
+                # Segue pela próxima conexão ainda não usada
+                pilha.append(vizinho)
+                break
+            else:
+                # Sem conexões restantes: a cidade entra na rota (em ordem reversa)
+                rota.append(pilha.pop())
+        
+        rota.reverse()
+        return rota
     
     def visualizar_grafo(self, titulo: str = "Grafo de Cidades Brasileiras", caminho_destaque: List[str] = None):
         """
@@ -238,6 +1065,16 @@ class GrafoCidadesBrasil:
             titulo: Título do gráfico
             caminho_destaque: Lista de cidades para destacar (resultado do DFS)
         """
+        # Importação tardia: só quem desenha paga o custo de matplotlib/networkx
+        try:
+            import matplotlib.pyplot as plt
+            import networkx as nx
+            from matplotlib.patches import Patch
+        except ImportError:
+            print("❌ ERRO: Instale as bibliotecas necessárias:")
+            print("   pip install matplotlib networkx")
+            raise
+        
         # Cria o grafo networkx
         G = nx.Graph()
         
@@ -258,7 +1095,7 @@ class GrafoCidadesBrasil:
             # Cria arestas do caminho percorrido pelo DFS
             caminho_arestas = []
             for i in range(len(caminho_destaque)-1):
-                if caminho_destaque[i+1] in self.grafo[caminho_destaque[i]]:
+                if self.tem_aresta(caminho_destaque[i], caminho_destaque[i+1]):
                     caminho_arestas.append((caminho_destaque[i], caminho_destaque[i+1]))
             
             # Desenha as arestas do caminho DFS em vermelho (ordem de exploração)
@@ -300,7 +1137,6 @@ class GrafoCidadesBrasil:
             nx.draw_networkx_labels(G, pos, labels_ordem, font_size=7, font_weight='bold')
             
             # Adiciona legenda
-            from matplotlib.patches import Patch
             legend_elements = [
                 Patch(facecolor='lime', edgecolor='black', label='Cidade Inicial'),
                 Patch(facecolor='lightcoral', edgecolor='black', label='Visitadas (ordem DFS)'),
@@ -321,28 +1157,96 @@ class GrafoCidadesBrasil:
         plt.tight_layout()
         plt.show()
     
-    def estatisticas(self):
-        """Exibe estatísticas do grafo."""
+    def resumo_estatisticas(self) -> Dict[str, object]:
+        """
+        Estatísticas básicas do grafo a partir dos agregados mantidos incrementalmente.
+        
+        Em grafos não-direcionados, a existência de ciclo vem do Union-Find:
+        uma floresta tem exatamente V - C arestas (C = número de componentes),
+        então há ciclo se e somente se E > V - C. Um laço (cidade ligada a ela
+        mesma) é ciclo por si só e ocupa uma única entrada na adjacência, por
+        isso é contado à parte. Com conexões de mão única, usa os SCCs (em
+        cache até a próxima alteração).
+        
+        Returns:
+            Dicionário com vertices, arestas, grau_medio, grau_maximo,
+            cidade_grau_maximo, histograma_graus e possui_ciclos
+        """
+        # Cada conexão comum ocupa duas entradas; cada laço, uma
+        num_arestas = (self.num_entradas - self.num_lacos) // 2 + self.num_lacos
+        num_vertices = len(self.cidades)
+        
+        if self.direcionado:
+            possui_ciclos = self.detectar_ciclo()
+        else:
+            possui_ciclos = self.num_lacos > 0 or num_arestas > num_vertices - self.numero_componentes()
+        
+        return {
+            "vertices": num_vertices,
+            "arestas": num_arestas,
+            "grau_medio": self.num_entradas / num_vertices if num_vertices else 0,
+            "grau_maximo": self.grau_maximo,
+            "cidade_grau_maximo": self.cidade_grau_maximo,
+            "histograma_graus": self.histograma_graus,
+            "possui_ciclos": possui_ciclos,
+        }
+    
+    def estatisticas_detalhadas(self) -> Dict[str, int]:
+        """
+        Estatísticas caras, calculadas sob demanda e guardadas até a próxima alteração.
+        
+        - componentes: número de componentes conectados
+        - diametro: maior distância (em conexões) entre duas cidades alcançáveis,
+          obtida com um BFS a partir de cada cidade: O(V · (V + E))
+        
+        Returns:
+            Dicionário com componentes e diametro
+        """
+        if self._estatisticas_caras is None:
+            diametro = 0
+            for origem in self.cidades:
+                distancias = {origem: 0}
+                fila = deque([origem])
+                while fila:
+                    atual = fila.popleft()
+                    for vizinho in self.grafo.get(atual, ()):
+                        if vizinho not in distancias:
+                            distancias[vizinho] = distancias[atual] + 1
+                            diametro = max(diametro, distancias[vizinho])
+                            fila.append(vizinho)
+            
+            self._estatisticas_caras = {
+                "componentes": self.numero_componentes(),
+                "diametro": diametro,
+            }
+        return self._estatisticas_caras
+    
+    def estatisticas(self, detalhado: bool = False):
+        """
+        Exibe estatísticas do grafo.
+        
+        Args:
+            detalhado: Se True, inclui diâmetro e componentes (cálculo caro, em cache)
+        """
+        resumo = self.resumo_estatisticas()
+        
         print("\n" + "="*60)
         print("ESTATÍSTICAS DO GRAFO")
         print("="*60)
-        print(f"Número de cidades (vértices): {self.num_vertices}")
-        
-        total_conexoes = sum(len(vizinhos) for vizinhos in self.grafo.values()) // 2
-        print(f"Número de conexões (arestas): {total_conexoes}")
-        
-        # Grau médio
-        graus = [len(self.grafo[cidade]) for cidade in self.cidades]
-        grau_medio = sum(graus) / len(graus) if graus else 0
-        print(f"Grau médio: {grau_medio:.2f}")
+        print(f"Número de cidades (vértices): {resumo['vertices']}")
+        print(f"Número de conexões (arestas): {resumo['arestas']}")
+        print(f"Grau médio: {resumo['grau_medio']:.2f}")
         
         # Cidade com mais conexões
-        cidade_max = max(self.cidades, key=lambda c: len(self.grafo[c]))
-        print(f"Cidade com mais conexões: {cidade_max} ({len(self.grafo[cidade_max])} conexões)")
+        if resumo['cidade_grau_maximo'] is not None:
+            print(f"Cidade com mais conexões: {resumo['cidade_grau_maximo']} ({resumo['grau_maximo']} conexões)")
+        
+        print(f"Possui ciclos: {'Sim' if resumo['possui_ciclos'] else 'Não'}")
         
-        # Verifica ciclos
-        tem_ciclo = self.detectar_ciclo()
-        print(f"Possui ciclos: {'Sim' if tem_ciclo else 'Não'}")
+        if detalhado:
+            detalhes = self.estatisticas_detalhadas()
+            print(f"Componentes conectados: {detalhes['componentes']}")
+            print(f"Diâmetro: {detalhes['diametro']} conexões")
         print("="*60)
 
 
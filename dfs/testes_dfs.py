@@ -3,6 +3,10 @@ TESTES UNITÁRIOS PARA O ALGORITMO DFS
 Verificação da corretude da implementação
 """
 
+import os
+import random
+import subprocess
+import sys
 import unittest
 from dfs_cidades_brasil import GrafoCidadesBrasil, criar_grafo_brasil
 
@@ -113,6 +117,576 @@ class TestDFS(unittest.TestCase):
         # B ou C pode vir primeiro dependendo da ordem de inserção
 
 
+class TestMotorIterativo(unittest.TestCase):
+    """Testes do motor de DFS sem recursão."""
+    
+    def _ordem_recursiva(self, grafo, cidade, visitados=None):
+        """Ordem de visitação da implementação recursiva original (referência)."""
+        if visitados is None:
+            visitados = set()
+        visitados.add(cidade)
+        ordem = [cidade]
+        for vizinho in grafo.grafo[cidade]:
+            if vizinho not in visitados:
+                ordem.extend(self._ordem_recursiva(grafo, vizinho, visitados))
+        return ordem
+    
+    def _cadeia(self, tamanho):
+        """Cria uma cadeia C0 - C1 - ... - C(tamanho-1)."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(tamanho - 1):
+            grafo.adicionar_aresta(f"C{i}", f"C{i+1}")
+        return grafo
+    
+    def test_mesma_ordem_da_versao_recursiva(self):
+        """A ordem de visitação deve ser igual à da recursão original."""
+        grafo = criar_grafo_brasil()
+        for cidade in sorted(grafo.cidades):
+            self.assertEqual(grafo.dfs_recursivo(cidade), self._ordem_recursiva(grafo, cidade))
+    
+    def test_cadeia_longa_sem_estouro_de_recursao(self):
+        """Cadeias maiores que o limite de recursão não devem falhar."""
+        grafo = self._cadeia(20000)
+        
+        self.assertEqual(len(grafo.dfs_recursivo("C0")), 20000)
+        self.assertEqual(len(grafo.dfs_completo()), 1)
+        self.assertEqual(len(grafo.encontrar_caminho_dfs("C0", "C19999")), 20000)
+        self.assertFalse(grafo.detectar_ciclo())
+        
+        grafo.adicionar_aresta("C19999", "C0")
+        self.assertTrue(grafo.detectar_ciclo())
+    
+    def test_callbacks_pre_e_pos_ordem(self):
+        """Pré-ordem e pós-ordem do motor devem seguir a estrutura da árvore DFS."""
+        entradas, saidas = [], []
+        self.assertFalse(self._cadeia(4)._percorrer_dfs(
+            "C0", set(),
+            ao_entrar=lambda c, pai: entradas.append((c, pai)),
+            ao_sair=lambda c: saidas.append(c)))
+        
+        self.assertEqual(entradas, [("C0", None), ("C1", "C0"), ("C2", "C1"), ("C3", "C2")])
+        self.assertEqual(saidas, ["C3", "C2", "C1", "C0"])
+
+
+class TestPontosCriticos(unittest.TestCase):
+    """Testes da análise de pontes, articulações e componentes biconexos."""
+    
+    def _pontes_forca_bruta(self, grafo):
+        """Referência O(E·(V+E)): remove cada estrada e conta componentes."""
+        arestas = {tuple(sorted((a, b))) for a in grafo.grafo for b in grafo.grafo[a]}
+        base = len(grafo.dfs_completo())
+        pontes = set()
+        for a, b in arestas:
+            teste = GrafoCidadesBrasil()
+            teste.cidades = set(grafo.cidades)
+            for x, y in arestas - {(a, b)}:
+                teste.adicionar_aresta(x, y)
+            if len(teste.dfs_completo()) > base:
+                pontes.add((a, b))
+        return pontes
+    
+    def test_pontes_iguais_a_forca_bruta(self):
+        """As pontes encontradas devem coincidir com a remoção estrada a estrada."""
+        grafo = criar_grafo_brasil()
+        pontes, _, _ = grafo.analisar_pontos_criticos()
+        self.assertEqual({tuple(sorted(p)) for p in pontes}, self._pontes_forca_bruta(grafo))
+    
+    def test_duas_componentes_ligadas_por_ponte(self):
+        """Dois triângulos ligados por uma estrada: 1 ponte, 2 articulações, 3 componentes."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"),
+                     ("D", "E"), ("E", "F"), ("F", "D")]:
+            grafo.adicionar_aresta(a, b)
+        
+        pontes, articulacoes, componentes = grafo.analisar_pontos_criticos()
+        
+        self.assertEqual([tuple(sorted(p)) for p in pontes], [("C", "D")])
+        self.assertEqual(articulacoes, {"C", "D"})
+        self.assertEqual(sorted(len(c) for c in componentes), [1, 3, 3])
+        self.assertEqual(sum(len(c) for c in componentes), 7)
+    
+    def test_ciclo_nao_tem_pontos_criticos(self):
+        """Um ciclo simples não tem pontes nem articulações."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(5):
+            grafo.adicionar_aresta(f"C{i}", f"C{(i + 1) % 5}")
+        
+        pontes, articulacoes, componentes = grafo.analisar_pontos_criticos()
+        self.assertEqual(pontes, [])
+        self.assertEqual(articulacoes, set())
+        self.assertEqual(len(componentes), 1)
+    
+    def test_cadeia_longa(self):
+        """Em uma cadeia, toda estrada é ponte e toda cidade interna é articulação."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(9999):
+            grafo.adicionar_aresta(f"C{i}", f"C{i+1}")
+        
+        pontes, articulacoes, _ = grafo.analisar_pontos_criticos()
+        self.assertEqual(len(pontes), 9999)
+        self.assertEqual(len(articulacoes), 9998)
+
+
+class TestComponentesIncrementais(unittest.TestCase):
+    """Testes dos componentes mantidos por Union-Find."""
+    
+    def test_componentes_acompanham_novas_estradas(self):
+        """Cada estrada nova deve atualizar os componentes sem refazer o DFS."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "B")
+        grafo.adicionar_aresta("X", "Y")
+        self.assertEqual(grafo.numero_componentes(), 2)
+        self.assertFalse(grafo.mesmo_componente("A", "Y"))
+        
+        grafo.adicionar_aresta("B", "X")
+        self.assertEqual(grafo.numero_componentes(), 1)
+        self.assertTrue(grafo.mesmo_componente("A", "Y"))
+        self.assertEqual(grafo.componente_de("A"), grafo.componente_de("Y"))
+        self.assertIsNone(grafo.componente_de("Cidade Falsa"))
+    
+    def test_remocao_recalcula_componentes(self):
+        """Remover a única ligação entre dois grupos deve separá-los."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "B")
+        grafo.adicionar_aresta("B", "C")
+        grafo.remover_aresta("A", "B")
+        
+        self.assertNotIn("B", grafo.grafo["A"])
+        self.assertEqual(grafo.numero_componentes(), 2)
+        self.assertTrue(grafo.mesmo_componente("B", "C"))
+        self.assertFalse(grafo.mesmo_componente("A", "C"))
+    
+    def test_concorda_com_dfs_completo(self):
+        """No grafo do Brasil, o número de componentes deve bater com o DFS completo."""
+        grafo = criar_grafo_brasil()
+        grafo.cidades.add("Ilha Isolada")
+        self.assertEqual(grafo.numero_componentes(), len(grafo.dfs_completo()))
+
+
+class TestIndiceAlcance(unittest.TestCase):
+    """Testes das consultas de alcançabilidade sem DFS."""
+    
+    def _alcanca_por_dfs(self, grafo, origem, destino):
+        """Referência: alcançabilidade por DFS a partir da origem."""
+        return destino in grafo.dfs_recursivo(origem)
+    
+    def test_grafo_nao_direcionado(self):
+        """Sem mão única, a resposta vem dos rótulos de componente."""
+        grafo = criar_grafo_brasil()
+        grafo.adicionar_aresta("Ilha A", "Ilha B")
+        
+        self.assertFalse(grafo.direcionado)
+        self.assertTrue(grafo.alcanca("Manaus", "Porto Alegre"))
+        self.assertFalse(grafo.alcanca("Manaus", "Ilha A"))
+        self.assertEqual(grafo.encontrar_caminho_dfs("Manaus", "Ilha B"), [])
+    
+    def test_grafo_direcionado_concorda_com_dfs(self):
+        """Com mão única, o índice deve concordar com o DFS para todos os pares."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"),
+                     ("D", "E"), ("E", "D"), ("F", "E"), ("G", "G")]:
+            grafo.adicionar_aresta(a, b, bidirecional=False)
+        
+        for origem in grafo.cidades:
+            for destino in grafo.cidades:
+                self.assertEqual(grafo.alcanca(origem, destino),
+                                 self._alcanca_por_dfs(grafo, origem, destino),
+                                 f"{origem} -> {destino}")
+    
+    def test_indice_invalidado_apos_alteracao(self):
+        """Uma nova conexão deve descartar o índice antigo."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "B", bidirecional=False)
+        self.assertFalse(grafo.alcanca("B", "A"))
+        
+        grafo.adicionar_aresta("B", "A", bidirecional=False)
+        self.assertTrue(grafo.alcanca("B", "A"))
+        self.assertEqual(grafo.encontrar_caminho_dfs("B", "A"), ["B", "A"])
+    
+    def test_indice_explicito_concorda_com_dfs(self):
+        """Os rótulos compactos + DFS podado devem dar a resposta exata em todos os pares."""
+        gerador = random.Random(5)
+        grafo = GrafoCidadesBrasil()
+        for _ in range(300):
+            a, b = gerador.randrange(120), gerador.randrange(120)
+            grafo.adicionar_aresta(f"C{a}", f"C{b}", bidirecional=False)
+        
+        alcancaveis = {}
+        for origem in grafo.cidades:
+            visitados = set()
+            grafo._percorrer_dfs(origem, visitados)
+            alcancaveis[origem] = visitados
+        
+        indice = grafo.indice_alcance()
+        for origem in grafo.cidades:
+            for destino in grafo.cidades:
+                self.assertEqual(indice.alcanca(origem, destino), destino in alcancaveis[origem],
+                                 f"{origem} -> {destino}")
+    
+    def test_cadeia_mao_unica_grande(self):
+        """Cadeia de mão única com 100 mil cidades: sem fecho transitivo implícito."""
+        grafo = GrafoCidadesBrasil()
+        total = 100000
+        for i in range(total - 1):
+            grafo.adicionar_aresta(f"v{i}", f"v{i+1}", bidirecional=False)
+        
+        # Consultas sem índice: um DFS, sem construir SCCs nem índice
+        self.assertEqual(grafo.encontrar_caminho_dfs("v5", "v0"), [])
+        self.assertEqual(list(grafo.caminhos_simples("v5", "v0")), [])
+        self.assertIsNone(grafo._indice_alcance)
+        self.assertIsNone(grafo._dag)
+        
+        # Índice opt-in: memória linear no número de SCCs
+        indice = grafo.indice_alcance()
+        self.assertLessEqual(indice.memoria_bytes(), 32 * total)
+        self.assertTrue(grafo.alcanca("v10", f"v{total - 1}"))
+        self.assertFalse(grafo.alcanca(f"v{total - 1}", "v10"))
+        self.assertFalse(grafo.alcanca("v5", "v0"))
+
+
+class TestComponentesFortes(unittest.TestCase):
+    """Testes dos componentes fortemente conexos e do DAG de condensação."""
+    
+    def setUp(self):
+        """Grafo de mão única com três SCCs: {A, B, C} -> {D, E} <- {F}."""
+        self.grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"),
+                     ("D", "E"), ("E", "D"), ("F", "E")]:
+            self.grafo.adicionar_aresta(a, b, bidirecional=False)
+    
+    def test_componentes(self):
+        """Os SCCs devem agrupar as cidades que se alcançam mutuamente."""
+        dag = self.grafo.componentes_fortemente_conexos()
+        grupos = sorted(sorted(membros) for membros in dag.componentes)
+        self.assertEqual(grupos, [["A", "B", "C"], ["D", "E"], ["F"]])
+    
+    def test_dag_e_ordem_topologica(self):
+        """Toda conexão do DAG deve ir de um SCC anterior para um posterior na ordem."""
+        dag = self.grafo.componentes_fortemente_conexos()
+        posicao = {scc: i for i, scc in enumerate(dag.ordem_topologica)}
+        
+        arestas = {(dag.componente["A"], dag.componente["D"]),
+                   (dag.componente["F"], dag.componente["D"])}
+        obtidas = {(o, d) for o in range(len(dag)) for d in dag.sucessores[o]}
+        self.assertEqual(obtidas, arestas)
+        for origem, destino in obtidas:
+            self.assertLess(posicao[origem], posicao[destino])
+    
+    def test_ciclo_direcionado(self):
+        """Em mão única, A -> B -> A é ciclo, mas A -> B, A -> C, B -> C não é."""
+        self.assertTrue(self.grafo.detectar_ciclo())
+        
+        ida_e_volta = GrafoCidadesBrasil()
+        ida_e_volta.adicionar_aresta("A", "B", bidirecional=False)
+        ida_e_volta.adicionar_aresta("B", "A", bidirecional=False)
+        self.assertTrue(ida_e_volta.detectar_ciclo())
+        
+        aciclico = GrafoCidadesBrasil()
+        aciclico.adicionar_aresta("A", "B", bidirecional=False)
+        aciclico.adicionar_aresta("A", "C", bidirecional=False)
+        aciclico.adicionar_aresta("B", "C", bidirecional=False)
+        self.assertFalse(aciclico.detectar_ciclo())
+
+
+class TestEstatisticas(unittest.TestCase):
+    """Testes das estatísticas mantidas incrementalmente."""
+    
+    def _resumo_recalculado(self, grafo):
+        """Referência: recalcula as estatísticas varrendo o grafo inteiro."""
+        graus = [len(grafo.grafo[c]) for c in grafo.cidades]
+        histograma = {}
+        for grau in graus:
+            if grau > 0:
+                histograma[grau] = histograma.get(grau, 0) + 1
+        return {
+            "arestas": sum(graus) // 2,
+            "grau_maximo": max(graus),
+            "histograma_graus": histograma,
+            "possui_ciclos": grafo.detectar_ciclo(),
+        }
+    
+    def test_agregados_batem_com_recalculo(self):
+        """Agregados incrementais devem ser iguais ao recálculo completo."""
+        grafo = criar_grafo_brasil()
+        resumo = grafo.resumo_estatisticas()
+        esperado = self._resumo_recalculado(grafo)
+        
+        for chave, valor in esperado.items():
+            self.assertEqual(resumo[chave], valor, chave)
+        self.assertEqual(len(grafo.grafo[resumo["cidade_grau_maximo"]]), resumo["grau_maximo"])
+    
+    def test_ciclo_pelo_union_find(self):
+        """Uma árvore não tem ciclo; fechar um triângulo cria ciclo."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "B")
+        grafo.adicionar_aresta("B", "C")
+        grafo.adicionar_aresta("X", "Y")
+        self.assertFalse(grafo.resumo_estatisticas()["possui_ciclos"])
+        
+        grafo.adicionar_aresta("C", "A")
+        self.assertTrue(grafo.resumo_estatisticas()["possui_ciclos"])
+        
+        grafo.remover_aresta("C", "A")
+        resumo = grafo.resumo_estatisticas()
+        self.assertFalse(resumo["possui_ciclos"])
+        self.assertEqual(resumo["histograma_graus"], {1: 4, 2: 1})
+        self.assertEqual(resumo["grau_maximo"], 2)
+    
+    def test_lacos(self):
+        """Laços contam como conexão e como ciclo, como em detectar_ciclo()."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "A")
+        resumo = grafo.resumo_estatisticas()
+        self.assertEqual(resumo["arestas"], 1)
+        self.assertTrue(resumo["possui_ciclos"])
+        self.assertEqual(resumo["possui_ciclos"], grafo.detectar_ciclo())
+        
+        grafo.adicionar_aresta("A", "B")
+        grafo.adicionar_aresta("B", "C")
+        grafo.adicionar_aresta("C", "C")
+        resumo = grafo.resumo_estatisticas()
+        self.assertEqual(resumo["arestas"], 4)
+        self.assertEqual(resumo["possui_ciclos"], grafo.detectar_ciclo())
+        
+        grafo.remover_aresta("A", "A")
+        grafo.remover_aresta("C", "C")
+        resumo = grafo.resumo_estatisticas()
+        self.assertEqual(resumo["arestas"], 2)
+        self.assertFalse(resumo["possui_ciclos"])
+        self.assertEqual(resumo["possui_ciclos"], grafo.detectar_ciclo())
+    
+    def test_estatisticas_detalhadas_em_cache(self):
+        """Diâmetro e componentes devem ser calculados uma vez e invalidados ao alterar."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(4):
+            grafo.adicionar_aresta(f"C{i}", f"C{i+1}")
+        grafo.adicionar_aresta("X", "Y")
+        
+        detalhes = grafo.estatisticas_detalhadas()
+        self.assertEqual(detalhes, {"componentes": 2, "diametro": 4})
+        self.assertIs(grafo.estatisticas_detalhadas(), detalhes)
+        
+        grafo.adicionar_aresta("C0", "C4")
+        self.assertEqual(grafo.estatisticas_detalhadas()["diametro"], 2)
+
+
+class TestAdjacenciaSemRepeticao(unittest.TestCase):
+    """Testes da adjacência deduplicada com consulta de aresta em O(1)."""
+    
+    def test_arestas_repetidas_sao_ignoradas(self):
+        """Repetir uma estrada não deve duplicar vizinhos nem alterar estatísticas."""
+        grafo = GrafoCidadesBrasil()
+        for _ in range(3):
+            grafo.adicionar_aresta("A", "B")
+            grafo.adicionar_aresta("B", "A")
+        grafo.adicionar_aresta("A", "C")
+        
+        self.assertEqual(list(grafo.grafo["A"]), ["B", "C"])
+        self.assertEqual(list(grafo.grafo["B"]), ["A"])
+        self.assertEqual(grafo.resumo_estatisticas()["arestas"], 2)
+        self.assertEqual(grafo.dfs_recursivo("A"), ["A", "B", "C"])
+    
+    def test_tem_aresta(self):
+        """tem_aresta respeita o sentido das conexões de mão única."""
+        grafo = GrafoCidadesBrasil()
+        grafo.adicionar_aresta("A", "B")
+        grafo.adicionar_aresta("B", "C", bidirecional=False)
+        
+        self.assertTrue(grafo.tem_aresta("A", "B"))
+        self.assertTrue(grafo.tem_aresta("B", "A"))
+        self.assertTrue(grafo.tem_aresta("B", "C"))
+        self.assertFalse(grafo.tem_aresta("C", "B"))
+        self.assertFalse(grafo.tem_aresta("A", "Inexistente"))
+        
+        grafo.remover_aresta("A", "B")
+        self.assertFalse(grafo.tem_aresta("A", "B"))
+        self.assertFalse(grafo.tem_aresta("B", "A"))
+    
+    def test_ordem_de_insercao_preservada(self):
+        """A ordem de visita do DFS segue a ordem de inserção das estradas."""
+        grafo = GrafoCidadesBrasil()
+        for vizinho in ["D", "B", "C", "B", "D"]:
+            grafo.adicionar_aresta("A", vizinho)
+        
+        self.assertEqual(list(grafo.grafo["A"]), ["D", "B", "C"])
+        self.assertEqual(grafo.dfs_iterativo("A"), ["A", "D", "B", "C"])
+
+
+class TestCaminhosSimples(unittest.TestCase):
+    """Testes do gerador de caminhos simples alternativos."""
+    
+    def _todos_caminhos(self, grafo, atual, destino, caminho):
+        """Referência: enumeração recursiva sem poda."""
+        if atual == destino:
+            yield list(caminho)
+            return
+        for vizinho in grafo.grafo.get(atual, ()):
+            if vizinho not in caminho:
+                caminho.append(vizinho)
+                yield from self._todos_caminhos(grafo, vizinho, destino, caminho)
+                caminho.pop()
+    
+    def test_mesmos_caminhos_da_referencia(self):
+        """Sem limites, gera exatamente os caminhos da enumeração completa."""
+        grafo = criar_grafo_brasil()
+        gerados = list(grafo.caminhos_simples("Curitiba", "Florianópolis"))
+        esperados = list(self._todos_caminhos(grafo, "Curitiba", "Florianópolis", ["Curitiba"]))
+        
+        self.assertEqual(sorted(gerados), sorted(esperados))
+        self.assertEqual(len(set(map(tuple, gerados))), len(gerados))
+    
+    def test_limites_de_tamanho_e_quantidade(self):
+        """max_conexoes filtra pelo tamanho; max_caminhos interrompe a geração."""
+        grafo = criar_grafo_brasil()
+        esperados = list(self._todos_caminhos(grafo, "São Paulo", "Salvador", ["São Paulo"]))
+        
+        curtos = list(grafo.caminhos_simples("São Paulo", "Salvador", max_conexoes=3))
+        self.assertEqual(sorted(curtos), sorted(c for c in esperados if len(c) - 1 <= 3))
+        self.assertEqual(len(list(grafo.caminhos_simples("São Paulo", "Salvador", max_caminhos=5))), 5)
+        self.assertEqual(list(grafo.caminhos_simples("São Paulo", "Salvador", max_conexoes=1)), [])
+    
+    def test_mao_unica_e_inalcancavel(self):
+        """Respeita o sentido das conexões e não gera nada sem caminho."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("A", "C"), ("C", "D")]:
+            grafo.adicionar_aresta(a, b, bidirecional=False)
+        
+        self.assertEqual(sorted(grafo.caminhos_simples("A", "D")),
+                         [["A", "B", "C", "D"], ["A", "C", "D"]])
+        self.assertEqual(list(grafo.caminhos_simples("D", "A")), [])
+        self.assertEqual(list(grafo.caminhos_simples("A", "A")), [["A"]])
+    
+    def test_caminho_profundo_sem_recursao(self):
+        """Um caminho com milhares de cidades não estoura a pilha de recursão."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(5000):
+            grafo.adicionar_aresta(f"C{i}", f"C{i+1}")
+        
+        caminhos = list(grafo.caminhos_simples("C0", "C5000"))
+        self.assertEqual(len(caminhos), 1)
+        self.assertEqual(len(caminhos[0]), 5001)
+
+
+class TestCaminhoEuleriano(unittest.TestCase):
+    """Testes da rota euleriana (Hierholzer)."""
+    
+    def _verificar_rota(self, grafo, rota, direcionado=False):
+        """A rota deve usar cada conexão existente exatamente uma vez."""
+        usadas = [(a, b) if direcionado else tuple(sorted((a, b))) for a, b in zip(rota, rota[1:])]
+        existentes = {(a, b) if direcionado else tuple(sorted((a, b)))
+                      for a in grafo.grafo for b in grafo.grafo[a]}
+        self.assertEqual(len(usadas), len(set(usadas)))
+        self.assertEqual(set(usadas), existentes)
+    
+    def test_circuito(self):
+        """Dois triângulos unidos por uma cidade formam um circuito."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("A", "D"), ("D", "E"), ("E", "A")]:
+            grafo.adicionar_aresta(a, b)
+        
+        rota = grafo.caminho_euleriano("B")
+        self.assertEqual(rota[0], "B")
+        self.assertEqual(rota[-1], "B")
+        self._verificar_rota(grafo, rota)
+    
+    def test_caminho_entre_cidades_de_grau_impar(self):
+        """O caminho começa e termina nas duas cidades de grau ímpar."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("A", "C"), ("C", "E"), ("E", "A")]:
+            grafo.adicionar_aresta(a, b)
+        grafo.adicionar_aresta("B", "D")
+        
+        rota = grafo.caminho_euleriano()
+        self.assertEqual({rota[0], rota[-1]}, {"B", "D"})
+        self._verificar_rota(grafo, rota)
+        
+        with self.assertRaises(ValueError) as erro:
+            grafo.caminho_euleriano("A")
+        self.assertIn("B ou D", str(erro.exception))
+    
+    def test_falha_com_cidades_problematicas(self):
+        """O grafo do Brasil não é euleriano: o erro lista as cidades de grau ímpar."""
+        grafo = criar_grafo_brasil()
+        impares = sorted(c for c in grafo.cidades if len(grafo.grafo[c]) % 2)
+        
+        with self.assertRaises(ValueError) as erro:
+            grafo.caminho_euleriano()
+        for cidade in impares:
+            self.assertIn(cidade, str(erro.exception))
+    
+    def test_componentes_desconexos(self):
+        """Dois circuitos separados não formam uma rota única."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("X", "Y"), ("Y", "Z"), ("Z", "X")]:
+            grafo.adicionar_aresta(a, b)
+        
+        with self.assertRaises(ValueError) as erro:
+            grafo.caminho_euleriano()
+        self.assertIn("2 componentes", str(erro.exception))
+    
+    def test_mao_unica(self):
+        """Com mão única, o caminho vai da cidade com saída extra até a com entrada extra."""
+        grafo = GrafoCidadesBrasil()
+        for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("A", "D")]:
+            grafo.adicionar_aresta(a, b, bidirecional=False)
+        
+        rota = grafo.caminho_euleriano()
+        self.assertEqual(rota, ["A", "B", "C", "A", "D"])
+        self._verificar_rota(grafo, rota, direcionado=True)
+        
+        grafo.adicionar_aresta("A", "E", bidirecional=False)
+        with self.assertRaises(ValueError) as erro:
+            grafo.caminho_euleriano()
+        self.assertIn("A (+2)", str(erro.exception))
+    
+    def test_circuito_longo_sem_recursao(self):
+        """Um anel com milhares de cidades não estoura a pilha de recursão."""
+        grafo = GrafoCidadesBrasil()
+        for i in range(5000):
+            grafo.adicionar_aresta(f"C{i}", f"C{(i + 1) % 5000}")
+        
+        rota = grafo.caminho_euleriano("C0")
+        self.assertEqual(len(rota), 5001)
+        self._verificar_rota(grafo, rota)
+
+
+class TestImportacaoLeve(unittest.TestCase):
+    """Importar os algoritmos não deve carregar matplotlib nem networkx."""
+    
+    DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+    BELLMAN_FORD = os.path.join(DIRETORIO, "..", "Bellman-Ford", "Bellman-Ford.py")
+    
+    def _importar_em_processo_novo(self, codigo):
+        """Executa 'codigo' num interpretador limpo e devolve (tempo, bibliotecas pesadas carregadas)."""
+        script = (
+            "import sys, time\n"
+            "inicio = time.perf_counter()\n"
+            f"{codigo}\n"
+            "tempo = time.perf_counter() - inicio\n"
+            "pesadas = [m for m in ('matplotlib', 'networkx') if m in sys.modules]\n"
+            "print(tempo, ','.join(pesadas))\n"
+        )
+        saida = subprocess.run([sys.executable, "-c", script], cwd=self.DIRETORIO,
+                               capture_output=True, text=True, check=True).stdout.split()
+        return float(saida[0]), saida[1:]
+    
+    def test_dfs_sem_bibliotecas_de_desenho(self):
+        """import dfs_cidades_brasil usa só a biblioteca padrão."""
+        tempo, pesadas = self._importar_em_processo_novo("import dfs_cidades_brasil")
+        print(f"\n  import dfs_cidades_brasil: {tempo * 1000:.1f} ms")
+        self.assertEqual(pesadas, [])
+    
+    def test_bellman_ford_sem_bibliotecas_de_desenho(self):
+        """Carregar Bellman-Ford.py (sem executar o menu) usa só a biblioteca padrão."""
+        tempo, pesadas = self._importar_em_processo_novo(
+            "import importlib.util\n"
+            f"spec = importlib.util.spec_from_file_location('bellman_ford', {self.BELLMAN_FORD!r})\n"
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+        )
+        print(f"\n  import Bellman-Ford.py: {tempo * 1000:.1f} ms")
+        self.assertEqual(pesadas, [])
+
+
 class TestGrafoBrasil(unittest.TestCase):
     """Testes específicos para o grafo de cidades brasileiras."""
     
@@ -161,6 +735,16 @@ def executar_testes():
     
     # Adiciona testes
     suite.addTests(loader.loadTestsFromTestCase(TestDFS))
+    suite.addTests(loader.loadTestsFromTestCase(TestMotorIterativo))
+    suite.addTests(loader.loadTestsFromTestCase(TestPontosCriticos))
+    suite.addTests(loader.loadTestsFromTestCase(TestComponentesIncrementais))
+    suite.addTests(loader.loadTestsFromTestCase(TestIndiceAlcance))
+    suite.addTests(loader.loadTestsFromTestCase(TestComponentesFortes))
+    suite.addTests(loader.loadTestsFromTestCase(TestEstatisticas))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdjacenciaSemRepeticao))
+    suite.addTests(loader.loadTestsFromTestCase(TestCaminhosSimples))
+    suite.addTests(loader.loadTestsFromTestCase(TestCaminhoEuleriano))
+    suite.addTests(loader.loadTestsFromTestCase(TestImportacaoLeve))
     suite.addTests(loader.loadTestsFromTestCase(TestGrafoBrasil))
     
     # Executa